@@ -1,23 +1,41 @@
 """CLI command implementations."""
 
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set
+import os
 import sys
 
-from core.parser import parse_file, get_language_for_file
-from core.call_graph import build_call_graph, find_entry_points
+from core.parser import parse_files, parse_files_with_hash, LANGUAGE_BY_EXTENSION
+from core.call_graph import build_call_graph, build_name_index, find_entry_points
 from core.change_detector import (
     ChangeDetector, 
     record_baseline, 
-    detect_changes
+    detect_changes,
+    ChangeReport
 )
 from core.contract import FunctionContract, create_contract
 from storage.database import (
     ContractDatabase,
     save_contract,
-    get_contract,
-    save_call_graph
+    contract_exists,
+    save_call_graph,
+    save_baseline,
+    load_baseline
 )
+from storage.parse_cache import (
+    ParseCache,
+    get_cached_functions,
+    store_functions,
+    prune_cache,
+    save_parse_cache
+)
+
+
+SKIPPED_DIRECTORIES: FrozenSet[str] = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'dist',
+    'build', '.mypy_cache', '.pytest_cache', '.abstraction'
+})
 
 
 def initialize_project(project_path: str) -> bool:
@@ -44,12 +62,13 @@ def initialize_project(project_path: str) -> bool:
 
 def index_source_directory(
     source_dir: str,
-    storage_dir: str
+    storage_dir: str,
+    mp_context: Optional[BaseContext] = None
 ) -> int:
     """
     Parse and index all source files in directory.
     
-    Preconditions: directories exist and are valid
+    Preconditions: directories exist and are valid, mp_context as for parse_files
     Postconditions: returns count of indexed functions
     """
     assert source_dir, "Source directory required"
@@ -59,7 +78,8 @@ def index_source_directory(
     if not source_path.exists():
         return 0
     
-    all_functions = collect_functions_from_directory(source_path)
+    cache = ParseCache(storage_dir)
+    all_functions = collect_functions_from_directory(source_path, cache, mp_context)
     
     if not all_functions:
         return 0
@@ -71,6 +91,7 @@ def index_source_directory(
     
     detector = ChangeDetector()
     record_baseline(detector, all_functions)
+    save_baseline(db, detector)
     
     count = len(all_functions)
     assert count >= 0, "Count must be non-negative"
@@ -78,28 +99,133 @@ def index_source_directory(
     return count
 
 
-def collect_functions_from_directory(directory: Path) -> List:
+def collect_functions_from_directory(
+    directory: Path,
+    cache: Optional[ParseCache] = None,
+    mp_context: Optional[BaseContext] = None
+) -> List:
     """
     Recursively collect functions from all source files.
     
-    Preconditions: directory exists
-    Postconditions: returns list of FunctionInfo
+    Preconditions: directory exists, mp_context as for parse_files
+    Postconditions: returns list of FunctionInfo, unchanged files served from cache
     """
+    source_files = list(iter_source_files(directory))
+    
+    if cache is None:
+        results = parse_files(source_files, mp_context=mp_context)
+    else:
+        results = parse_files_cached(source_files, cache, mp_context)
+    
     all_functions = []
+    for path in source_files:
+        all_functions.extend(results[path])
     
-    for file_path in directory.rglob("*"):
-        if not file_path.is_file():
-            continue
-        
-        language = get_language_for_file(str(file_path))
-        if not language:
+    assert isinstance(all_functions, list), "Result must be list"
+    return all_functions
+
+
+def iter_source_files(root: Path) -> Iterator[str]:
+    """
+    Walk directory tree with os.scandir, yielding supported source file paths.
+    
+    Preconditions: root is an existing directory
+    Postconditions: yields every file below root with a known extension, including
+                    symlinked files; symlinked and unreadable directories are skipped
+    """
+    assert root is not None, "Root directory required"
+    
+    skipped = SKIPPED_DIRECTORIES | read_gitignored_directories(root)
+    stack = [str(root)]
+    
+    while stack:
+        current = stack.pop()
+        for entry in scan_directory(current):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skipped:
+                    stack.append(entry.path)
+            elif entry.is_file():
+                if os.path.splitext(entry.name)[1].lower() in LANGUAGE_BY_EXTENSION:
+                    yield entry.path
+
+
+def scan_directory(path: str) -> List[os.DirEntry]:
+    """
+    List directory entries, treating an unreadable directory as empty.
+    
+    Preconditions: path names a directory
+    Postconditions: returns entries of path, or empty list on OSError
+    """
+    assert path, "Path required"
+    
+    try:
+        with os.scandir(path) as entries:
+            result = list(entries)
+    except OSError:
+        result = []
+    
+    assert isinstance(result, list), "Result must be list"
+    return result
+
+
+def read_gitignored_directories(root: Path) -> Set[str]:
+    """
+    Read plain directory names listed in root's .gitignore.
+    
+    Preconditions: root is an existing directory
+    Postconditions: returns names of ignored directories (globs and negations skipped)
+    """
+    gitignore = Path(root) / '.gitignore'
+    if not gitignore.is_file():
+        return set()
+    
+    names = set()
+    for line in gitignore.read_text(encoding='utf-8', errors='replace').splitlines():
+        pattern = line.strip()
+        if not pattern.endswith('/') or pattern.startswith(('#', '!')):
             continue
         
-        functions = parse_file(str(file_path))
-        all_functions.extend(functions)
+        name = pattern.strip('/')
+        if name and '/' not in name and not any(c in name for c in '*?['):
+            names.add(name)
     
-    assert isinstance(all_functions, list), "Result must be list"
-    return all_functions
+    assert isinstance(names, set), "Result must be set"
+    return names
+
+
+def parse_files_cached(
+    source_files: List[str],
+    cache: ParseCache,
+    mp_context: Optional[BaseContext] = None
+) -> Dict[str, List]:
+    """
+    Parse source files, reusing cached results for unchanged files.
+    
+    Preconditions: source_files contains paths with supported languages,
+                   mp_context as for parse_files
+    Postconditions: returns FunctionInfo list per path, cache persisted
+    """
+    results: Dict[str, List] = {}
+    miss_stats = {}
+    
+    for path in source_files:
+        stat_result = os.stat(path)
+        cached = get_cached_functions(cache, path, stat_result)
+        if cached is None:
+            miss_stats[path] = stat_result
+        else:
+            results[path] = cached
+    
+    parsed = parse_files_with_hash(list(miss_stats), mp_context=mp_context)
+    for path, (functions, content_hash) in parsed.items():
+        store_functions(cache, path, miss_stats[path], functions, content_hash)
+        results[path] = functions
+    
+    prune_cache(cache, source_files)
+    save_parse_cache(cache)
+    
+    assert len(results) == len(set(source_files)), "One result per file"
+    return results
 
 
 def display_call_graph_info(
@@ -117,7 +243,7 @@ def display_call_graph_info(
     from storage.database import load_call_graph
     from core.call_graph import find_entry_points
     from visualization.graph_viewer import (
-        render_text_tree,
+        write_text_tree,
         print_graph_statistics
     )
     
@@ -134,38 +260,30 @@ def display_call_graph_info(
     print_graph_statistics(graph)
     
     entry_points = find_entry_points(graph)
-    
-    def find_function_key_by_name(name: str) -> Optional[str]:
-        """Find function key by function name."""
-        for key in graph.nodes:
-            if graph.nodes[key].function_name == name:
-                return key
-        return None
+    name_index = build_name_index(graph)
     
     if entry_points:
         entry_names = [graph.nodes[key].function_name for key in entry_points]
         print(f"\nEntry Points: {', '.join(entry_names)}")
         
         if entry_function:
-            function_key = find_function_key_by_name(entry_function)
-            if function_key:
+            function_keys = name_index.get(entry_function)
+            if function_keys:
+                function_key = function_keys[0]
                 print(f"\n{'='*70}")
                 print(f"Call Tree from '{entry_function}':")
                 print(f"{'='*70}")
-                tree = render_text_tree(graph, function_key, max_depth=10)
-                print(tree)
+                write_text_tree(sys.stdout, graph, function_key, max_depth=10)
             else:
-                all_names = [graph.nodes[key].function_name for key in graph.nodes.keys()]
                 print(f"\nError: Function '{entry_function}' not found in graph.")
-                print(f"Available functions: {', '.join(sorted(set(all_names)))}")
+                print(f"Available functions: {', '.join(sorted(name_index))}")
         else:
             first_entry_key = entry_points[0]
             first_entry_name = graph.nodes[first_entry_key].function_name
             print(f"\n{'='*70}")
             print(f"Call Tree from '{first_entry_name}':")
             print(f"{'='*70}")
-            tree = render_text_tree(graph, first_entry_key, max_depth=10)
-            print(tree)
+            write_text_tree(sys.stdout, graph, first_entry_key, max_depth=10)
             
             if len(entry_points) > 1:
                 print(f"\nNote: {len(entry_points)} entry points found. Showing first one.")
@@ -177,8 +295,7 @@ def display_call_graph_info(
             first_func_name = graph.nodes[first_func_key].function_name
             print(f"\nShowing tree from '{first_func_name}':")
             print("="*70)
-            tree = render_text_tree(graph, first_func_key, max_depth=10)
-            print(tree)
+            write_text_tree(sys.stdout, graph, first_func_key, max_depth=10)
     
     print("\n" + "="*70)
     
@@ -196,19 +313,52 @@ def check_for_changes(
     Postconditions: displays change report, returns True if changes
     """
     assert source_dir, "Source directory required"
+    assert storage_dir, "Storage directory required"
+    
+    db = ContractDatabase(storage_dir)
+    detector = load_baseline(db)
+    
+    if detector is None:
+        print("No baseline found. Run index first.")
+        return False
     
     source_path = Path(source_dir)
-    current_functions = collect_functions_from_directory(source_path)
+    cache = ParseCache(storage_dir)
+    current_functions = collect_functions_from_directory(source_path, cache)
     
-    detector = ChangeDetector()
+    report = detect_changes(detector, current_functions)
+    print_change_report(report)
     
-    if not current_functions:
-        print("No functions found in source directory")
-        return False
+    has_changes = bool(
+        report.modified_functions or
+        report.new_functions or
+        report.deleted_functions
+    )
+    return has_changes
+
+
+def print_change_report(report: ChangeReport) -> None:
+    """
+    Print change report sections to stdout.
     
-    record_baseline(detector, current_functions)
+    Preconditions: report is valid ChangeReport
+    Postconditions: each non-empty section printed, or a no-changes line
+    """
+    assert report is not None, "Report required"
     
-    return True
+    sections = [
+        ("Modified", report.modified_functions),
+        ("New", report.new_functions),
+        ("Deleted", report.deleted_functions)
+    ]
+    
+    if not any(names for _, names in sections):
+        print("No changes since last index")
+        return
+    
+    for title, names in sections:
+        if names:
+            print(f"{title} functions ({len(names)}): {', '.join(names)}")
 
 
 def add_contract_interactive(
@@ -227,9 +377,7 @@ def add_contract_interactive(
     
     db = ContractDatabase(storage_dir)
     
-    existing = get_contract(db, function_name, file_path)
-    
-    if existing:
+    if contract_exists(db, function_name, file_path):
         print(f"Updating contract for {function_name}")
     else:
         print(f"Creating new contract for {function_name}")
@@ -237,7 +385,7 @@ def add_contract_interactive(
     contract = create_contract(function_name, file_path, 1)
     save_contract(db, contract)
     
-    assert get_contract(db, function_name, file_path) is not None
+    assert contract_exists(db, function_name, file_path), "Contract must be saved"
     return True
 
 
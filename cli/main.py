@@ -11,7 +11,6 @@ from cli.commands import (
     check_for_changes,
     add_contract_interactive
 )
-from web.server import create_app
 
 
 def print_usage() -> None:
@@ -30,7 +29,9 @@ Usage:
   python -m cli.main graph                    Show call graph
   python -m cli.main check <source_dir>       Check for changes
   python -m cli.main contract <func> <file>   Add contract
-  python -m cli.main serve [port]            Start web server
+  python -m cli.main serve [port] [--uvicorn]
+                                              Start web server (--uvicorn: run
+                                              under uvicorn instead of Flask)
 
 Options:
   -h, --help    Show this help message
@@ -146,7 +147,7 @@ def run_serve_command(args: List[str]) -> int:
     """
     Start web server for visual interface.
     
-    Preconditions: args may contain port number
+    Preconditions: args may contain port number and --uvicorn flag
     Postconditions: starts Flask server, returns exit code
     """
     storage_dir = str(Path.cwd() / ".abstraction")
@@ -155,6 +156,9 @@ def run_serve_command(args: List[str]) -> int:
         print("Error: .abstraction directory not found. Run 'init' first.")
         return 1
     
+    use_uvicorn = '--uvicorn' in args
+    args = [arg for arg in args if arg != '--uvicorn']
+    
     port = 5000
     if args:
         try:
@@ -164,13 +168,19 @@ def run_serve_command(args: List[str]) -> int:
             print(f"Error: Invalid port number: {args[0]}")
             return 1
     
+    from web.server import ASGI_AVAILABLE, create_app, serve_app
+    
+    if use_uvicorn and not ASGI_AVAILABLE:
+        print("Error: --uvicorn requires uvicorn and asgiref to be installed")
+        return 1
+    
     app = create_app(storage_dir)
     
     print(f"Starting web server on http://localhost:{port}")
     print("Press Ctrl+C to stop")
     
     try:
-        app.run(host='127.0.0.1', port=port, debug=False)
+        serve_app(app, port, use_uvicorn)
     except KeyboardInterrupt:
         print("\nServer stopped")
         return 0
@@ -178,21 +188,24 @@ def run_serve_command(args: List[str]) -> int:
     return 0
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main CLI entry point.
     
-    Preconditions: sys.argv contains command line arguments
+    Preconditions: argv holds arguments after program name, or None for sys.argv
     Postconditions: returns exit code for shell
     """
-    assert len(sys.argv) >= 1, "At least program name required"
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    assert isinstance(argv, list), "Arguments must be list"
     
-    if len(sys.argv) < 2:
+    if not argv:
         print_usage()
         return 1
     
-    command = sys.argv[1]
-    args = sys.argv[2:]
+    command = argv[0]
+    args = argv[1:]
     
     commands = {
         'init': run_init_command,
@@ -1,24 +1,30 @@
 """Call graph construction and navigation."""
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, field
-import networkx as nx
+from collections import deque
+from functools import lru_cache
+import sys
 
 from .parser import FunctionInfo
 from .contract import FunctionContract
 
 
+KEY_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def create_function_key(name: str, file_path: str) -> str:
     """
     Create unique key for function.
     
     Preconditions: name and file_path are non-empty
-    Postconditions: returns unique identifier string
+    Postconditions: returns unique identifier string, same object per pair
     """
     assert name, "Name required"
     assert file_path, "File path required"
     
-    key = f"{file_path}::{name}"
+    key = sys.intern(f"{file_path}::{name}")
     
     assert "::" in key, "Key must contain separator"
     return key
@@ -60,10 +66,9 @@ class CallGraph:
         Preconditions: none
         Postconditions: empty graph ready for population
         """
-        self.graph = nx.DiGraph()
         self.nodes: Dict[str, CallGraphNode] = {}
         
-        assert len(self.graph) == 0, "Graph must start empty"
+        assert len(self.nodes) == 0, "Graph must start empty"
     
     def add_function(self, func_info: FunctionInfo) -> None:
         """
@@ -87,7 +92,6 @@ class CallGraph:
                 line_number=func_info.line_number
             )
             self.nodes[key] = node
-            self.graph.add_node(key, data=node)
         
         assert key in self.nodes, "Node must be added"
 
@@ -103,15 +107,12 @@ def build_call_graph(functions: List[FunctionInfo]) -> CallGraph:
     
     graph = CallGraph()
     
-    unique_keys = set()
     for func in functions:
-        key = create_function_key(func.name, func.file_path)
-        unique_keys.add(key)
         graph.add_function(func)
     
     add_call_edges(graph, functions)
     
-    assert len(graph.nodes) == len(unique_keys), f"All unique functions added: {len(graph.nodes)} nodes, {len(unique_keys)} unique functions"
+    assert len(graph.nodes) <= len(functions), "At most one node per function"
     assert len(graph.nodes) > 0 or len(functions) == 0, "Graph must have nodes if functions provided"
     return graph
 
@@ -123,6 +124,8 @@ def add_call_edges(graph: CallGraph, functions: List[FunctionInfo]) -> None:
     Preconditions: graph initialized, functions have call info
     Postconditions: graph contains all call edges
     """
+    name_index = build_name_index(graph)
+    
     for func in functions:
         caller_key = create_function_key(func.name, func.file_path)
         if caller_key not in graph.nodes:
@@ -131,16 +134,30 @@ def add_call_edges(graph: CallGraph, functions: List[FunctionInfo]) -> None:
         caller_node = graph.nodes[caller_key]
         
         for callee_name in func.calls:
-            callee_found = False
-            for key in graph.nodes:
-                node = graph.nodes[key]
-                if node.function_name == callee_name:
-                    callee_key = key
-                    add_edge(graph, caller_key, callee_key)
-                    caller_node.callees.add(callee_key)
-                    graph.nodes[callee_key].callers.add(caller_key)
-                    callee_found = True
-                    break
+            callee_keys = name_index.get(callee_name)
+            if not callee_keys:
+                continue
+            
+            callee_key = callee_keys[0]
+            caller_node.callees.add(callee_key)
+            graph.nodes[callee_key].callers.add(caller_key)
+
+
+def build_name_index(graph: CallGraph) -> Dict[str, List[str]]:
+    """
+    Map function names to node keys in graph insertion order.
+    
+    Preconditions: graph is populated
+    Postconditions: returns dict of function name to list of keys
+    """
+    assert graph is not None, "Graph required"
+    
+    name_index: Dict[str, List[str]] = {}
+    for key, node in graph.nodes.items():
+        name_index.setdefault(node.function_name, []).append(key)
+    
+    assert isinstance(name_index, dict), "Result must be dict"
+    return name_index
 
 
 def add_edge(graph: CallGraph, caller: str, callee: str) -> None:
@@ -148,12 +165,13 @@ def add_edge(graph: CallGraph, caller: str, callee: str) -> None:
     Add directed edge from caller to callee.
     
     Preconditions: both functions exist in graph
-    Postconditions: edge added to graph
+    Postconditions: edge recorded in caller's callees and callee's callers
     """
     assert caller in graph.nodes, "Caller must exist"
     assert callee in graph.nodes, "Callee must exist"
     
-    graph.graph.add_edge(caller, callee)
+    graph.nodes[caller].callees.add(callee)
+    graph.nodes[callee].callers.add(caller)
 
 
 def find_entry_points(graph: CallGraph) -> List[str]:
@@ -189,40 +207,86 @@ def get_call_path(
     assert start in graph.nodes, "Start function must exist"
     assert end in graph.nodes, "End function must exist"
     
-    try:
-        path = nx.shortest_path(graph.graph, start, end)
-        return path
-    except nx.NetworkXNoPath:
-        return None
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    
+    while queue:
+        current = queue.popleft()
+        if current == end:
+            return build_path_from_parents(parents, end)
+        for callee_key in graph.nodes[current].callees:
+            if callee_key in graph.nodes and callee_key not in parents:
+                parents[callee_key] = current
+                queue.append(callee_key)
+    
+    return None
+
+
+def build_path_from_parents(
+    parents: Dict[str, Optional[str]],
+    end: str
+) -> List[str]:
+    """
+    Reconstruct BFS path by following parent links back from end.
+    
+    Preconditions: end is in parents, parent chain terminates at None
+    Postconditions: returns path list ordered from start to end
+    """
+    assert end in parents, "End must have been reached"
+    
+    path = []
+    current: Optional[str] = end
+    while current is not None:
+        path.append(current)
+        current = parents[current]
+    path.reverse()
+    
+    assert path[-1] == end, "Path must finish at end"
+    return path
 
 
 def get_abstraction_depth(graph: CallGraph, function_key: str) -> int:
     """
     Calculate abstraction depth (distance from entry points).
     
-    Preconditions: function exists in graph
+    Preconditions: function exists in graph; callers needing many depths
+                   use compute_abstraction_depths once instead
     Postconditions: returns non-negative depth value
     """
     assert function_key in graph.nodes, "Function must exist"
     
-    entry_points = find_entry_points(graph)
-    if not entry_points:
-        return 0
+    result = compute_abstraction_depths(graph).get(function_key, 0)
+    assert result >= 0, "Depth must be non-negative"
     
-    if function_key in entry_points:
-        return 0
+    return result
+
+
+def compute_abstraction_depths(graph: CallGraph) -> Dict[str, int]:
+    """
+    Compute depth of every reachable function with one multi-source BFS.
     
-    min_depth = float('inf')
+    Preconditions: graph is populated
+    Postconditions: returns depth per key reachable from entry points
+    """
+    assert graph is not None, "Graph required"
     
-    for entry in entry_points:
-        path = get_call_path(graph, entry, function_key)
-        if path:
-            min_depth = min(min_depth, len(path) - 1)
+    depths: Dict[str, int] = {}
+    queue = deque()
     
-    result = 0 if min_depth == float('inf') else int(min_depth)
-    assert result >= 0, "Depth must be non-negative"
+    for key in find_entry_points(graph):
+        depths[key] = 0
+        queue.append(key)
     
-    return result
+    while queue:
+        current = queue.popleft()
+        child_depth = depths[current] + 1
+        for callee_key in graph.nodes[current].callees:
+            if callee_key in graph.nodes and callee_key not in depths:
+                depths[callee_key] = child_depth
+                queue.append(callee_key)
+    
+    assert len(depths) <= len(graph.nodes), "Depths limited to graph nodes"
+    return depths
 
 
 def get_descendants(graph: CallGraph, function_key: str) -> Set[str]:
@@ -234,27 +298,65 @@ def get_descendants(graph: CallGraph, function_key: str) -> Set[str]:
     """
     assert function_key in graph.nodes, "Function must exist"
     
-    descendants = set()
-    visit_descendants(graph, function_key, descendants)
+    nodes = graph.nodes
+    descendants: Set[str] = set()
+    stack = [function_key]
+    
+    while stack:
+        current = stack.pop()
+        for callee_key in nodes[current].callees:
+            if callee_key not in descendants:
+                descendants.add(callee_key)
+                stack.append(callee_key)
     
     assert isinstance(descendants, set), "Result must be set"
     return descendants
 
 
-def visit_descendants(
-    graph: CallGraph,
-    current: str,
-    visited: Set[str]
-) -> None:
+def find_strongly_connected_components(graph: CallGraph, root: str) -> List[List[str]]:
     """
-    Recursively visit all descendants.
+    Find strongly connected components reachable from root (iterative Tarjan).
     
-    Preconditions: current exists, visited set provided
-    Postconditions: visited contains all descendant keys
+    Preconditions: root exists in graph
+    Postconditions: returns components in reverse topological order (callees first);
+                    callee keys missing from graph form singleton components
     """
-    node = graph.nodes[current]
-    
-    for callee_key in node.callees:
-        if callee_key not in visited:
-            visited.add(callee_key)
-            visit_descendants(graph, callee_key, visited)
+    assert root in graph.nodes, "Root must exist"
+    
+    nodes = graph.nodes
+    index: Dict[str, int] = {root: 0}
+    low: Dict[str, int] = {root: 0}
+    stack = [root]
+    on_stack = {root}
+    work = [(root, iter(nodes[root].callees))]
+    components: List[List[str]] = []
+    
+    while work:
+        current, callees = work[-1]
+        for callee in callees:
+            if callee not in index:
+                index[callee] = low[callee] = len(index)
+                stack.append(callee)
+                on_stack.add(callee)
+                node = nodes.get(callee)
+                work.append((callee, iter(node.callees if node else ())))
+                break
+            if callee in on_stack:
+                low[current] = min(low[current], index[callee])
+        else:
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[current])
+            if low[current] == index[current]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == current:
+                        break
+                components.append(component)
+    
+    assert sum(len(c) for c in components) == len(index), "Each key in one component"
+    return components
@@ -1,11 +1,12 @@
 """Code change detection and tracking."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Set, Optional
+from typing import AbstractSet, Dict, List, Optional
 from pathlib import Path
 
 from .parser import FunctionInfo, parse_file, compute_code_hash
 from .contract import FunctionContract
+from .call_graph import create_function_key
 
 
 @dataclass
@@ -38,6 +39,7 @@ class ChangeDetector:
         Postconditions: empty baseline ready for recording
         """
         self.baseline: Dict[str, str] = {}
+        self.baseline_names: Dict[str, str] = {}
         self.function_locations: Dict[str, str] = {}
         
         assert len(self.baseline) == 0, "Baseline starts empty"
@@ -53,36 +55,19 @@ def record_baseline(detector: ChangeDetector, functions: List[FunctionInfo]) ->
     assert detector is not None, "Detector required"
     assert isinstance(functions, list), "Functions must be list"
     
+    keys = [create_function_key(func.name, func.file_path) for func in functions]
+    
     detector.baseline.clear()
+    detector.baseline.update(zip(keys, [func.code_hash for func in functions]))
+    detector.baseline_names.clear()
+    detector.baseline_names.update(zip(keys, [func.name for func in functions]))
     detector.function_locations.clear()
+    detector.function_locations.update((func.name, func.file_path) for func in functions)
     
-    unique_keys = set()
-    for func in functions:
-        key = create_function_key(func.name, func.file_path)
-        unique_keys.add(key)
-        detector.baseline[key] = func.code_hash
-        detector.function_locations[func.name] = func.file_path
-    
-    assert len(detector.baseline) == len(unique_keys), f"All unique functions recorded: {len(detector.baseline)} baseline entries, {len(unique_keys)} unique functions"
+    assert len(detector.baseline) == len(detector.baseline_names), "Names recorded for every baseline entry"
     assert len(detector.baseline) > 0 or len(functions) == 0, "Baseline must have entries if functions provided"
 
 
-def create_function_key(name: str, file_path: str) -> str:
-    """
-    Create unique key for function.
-    
-    Preconditions: name and file_path non-empty
-    Postconditions: returns unique identifier string
-    """
-    assert name, "Name required"
-    assert file_path, "File path required"
-    
-    key = f"{file_path}::{name}"
-    
-    assert "::" in key, "Key must contain separator"
-    return key
-
-
 def detect_changes(
     detector: ChangeDetector,
     current_functions: List[FunctionInfo]
@@ -96,20 +81,18 @@ def detect_changes(
     assert detector is not None, "Detector required"
     assert len(detector.baseline) > 0, "Baseline must be established"
     
-    modified = []
-    new = []
-    current_keys = set()
-    
-    for func in current_functions:
-        key = create_function_key(func.name, func.file_path)
-        current_keys.add(key)
-        
-        if key not in detector.baseline:
-            new.append(func.name)
-        elif detector.baseline[key] != func.code_hash:
-            modified.append(func.name)
-    
-    deleted = find_deleted_functions(detector, current_keys)
+    current = {
+        create_function_key(func.name, func.file_path): func
+        for func in current_functions
+    }
+    baseline = detector.baseline
+    
+    new = [func.name for key, func in current.items() if key not in baseline]
+    modified = [
+        func.name for key, func in current.items()
+        if key in baseline and baseline[key] != func.code_hash
+    ]
+    deleted = find_deleted_functions(detector, current.keys())
     affected = modified + new
     
     report = ChangeReport(
@@ -125,7 +108,7 @@ def detect_changes(
 
 def find_deleted_functions(
     detector: ChangeDetector,
-    current_keys: Set[str]
+    current_keys: AbstractSet[str]
 ) -> List[str]:
     """
     Find functions that existed in baseline but not in current.
@@ -133,12 +116,12 @@ def find_deleted_functions(
     Preconditions: detector has baseline, current_keys valid
     Postconditions: returns list of deleted function names
     """
-    deleted = []
-    
-    for key in detector.baseline:
-        if key not in current_keys:
-            func_name = extract_name_from_key(key)
-            deleted.append(func_name)
+    names = detector.baseline_names
+    deleted = [
+        names.get(key) or extract_name_from_key(key)
+        for key in detector.baseline
+        if key not in current_keys
+    ]
     
     assert isinstance(deleted, list), "Result must be list"
     return deleted
@@ -153,8 +136,7 @@ def extract_name_from_key(key: str) -> str:
     """
     assert "::" in key, "Key must contain separator"
     
-    parts = key.split("::")
-    name = parts[-1]
+    name = key.rpartition("::")[2]
     
     assert name, "Name must not be empty"
     return name
@@ -205,6 +187,7 @@ def update_baseline_for_function(
     old_hash = detector.baseline.get(key)
     
     detector.baseline[key] = func_info.code_hash
+    detector.baseline_names[key] = func_info.name
     detector.function_locations[func_info.name] = func_info.file_path
     
     assert detector.baseline[key] == func_info.code_hash, "Hash updated"
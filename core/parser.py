@@ -1,9 +1,15 @@
 """Code parsing for multiple languages."""
 
 import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, FrozenSet, List, Optional, Dict, Tuple, Union
+from dataclasses import dataclass, replace
 
 TREE_SITTER_AVAILABLE = False
 AVAILABLE_LANGUAGES = {}
@@ -51,6 +57,16 @@ except ImportError:
     TREE_SITTER_AVAILABLE = False
 
 
+PARALLEL_PARSE_MIN_FILES = 8
+PARALLEL_PARSE_CHUNKSIZE = 16
+TREE_CACHE_SIZE = 64
+CONTENT_CACHE_SIZE = 256
+
+_tree_cache: 'OrderedDict[Tuple[str, str], Tuple[bytes, Any]]' = OrderedDict()
+_content_cache: 'OrderedDict[Tuple[bytes, str], List[FunctionInfo]]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
 @dataclass
 class FunctionInfo:
     """
@@ -68,22 +84,66 @@ class FunctionInfo:
     code_hash: str
 
 
-def compute_code_hash(code: str) -> str:
+def compute_code_hash(code: Union[str, bytes]) -> str:
     """
     Compute SHA-256 hash of code content.
     
-    Preconditions: code is a string
-    Postconditions: returns 64-character hex string
+    Preconditions: code is a string or its UTF-8 bytes
+    Postconditions: returns 64-character hex string, same for str and its UTF-8 bytes
     """
-    assert isinstance(code, str), "Code must be string"
+    assert isinstance(code, (str, bytes)), "Code must be string or bytes"
     
-    hash_obj = hashlib.sha256(code.encode('utf-8'))
-    result = hash_obj.hexdigest()
+    if isinstance(code, str):
+        code = code.encode('utf-8')
+    
+    result = hashlib.sha256(code).hexdigest()
     
     assert len(result) == 64, "SHA-256 hash must be 64 chars"
     return result
 
 
+LANGUAGE_BY_EXTENSION: Dict[str, str] = {
+    '.py': 'python',
+    '.c': 'c',
+    '.h': 'c',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.hpp': 'cpp',
+    '.hxx': 'cpp',
+    '.ts': 'typescript',
+    '.tsx': 'tsx',
+    '.js': 'javascript',
+    '.jsx': 'jsx'
+}
+
+_JS_FUNCTION_NODE_TYPES = ('function_declaration', 'method_definition', 'function', 'arrow_function')
+
+FUNCTION_NODE_TYPES: Dict[str, Tuple[str, ...]] = {
+    'python': ('function_definition',),
+    'c': ('function_definition',),
+    'cpp': ('function_definition',),
+    'typescript': _JS_FUNCTION_NODE_TYPES,
+    'tsx': _JS_FUNCTION_NODE_TYPES,
+    'javascript': _JS_FUNCTION_NODE_TYPES,
+    'jsx': _JS_FUNCTION_NODE_TYPES
+}
+
+FUNCTION_NODE_TYPE_SETS: Dict[str, FrozenSet[str]] = {
+    language: frozenset(node_types)
+    for language, node_types in FUNCTION_NODE_TYPES.items()
+}
+
+FUNCTION_NODE_TYPE_RANKS: Dict[str, Dict[str, int]] = {
+    language: {node_type: rank for rank, node_type in enumerate(node_types)}
+    for language, node_types in FUNCTION_NODE_TYPES.items()
+}
+
+JS_NAME_NODE_TYPES: FrozenSet[str] = frozenset({'property_identifier', 'identifier'})
+
+CALL_NODE_TYPES: FrozenSet[str] = frozenset({'call', 'call_expression', 'new_expression'})
+
+
 def get_language_for_file(file_path: str) -> Optional[str]:
     """
     Determine language from file extension.
@@ -93,25 +153,10 @@ def get_language_for_file(file_path: str) -> Optional[str]:
     """
     assert file_path, "File path cannot be empty"
     
-    suffix = Path(file_path).suffix.lower()
-    language_map = {
-        '.py': 'python',
-        '.c': 'c',
-        '.h': 'c',
-        '.cpp': 'cpp',
-        '.cc': 'cpp',
-        '.cxx': 'cpp',
-        '.hpp': 'cpp',
-        '.hxx': 'cpp',
-        '.ts': 'typescript',
-        '.tsx': 'tsx',
-        '.js': 'javascript',
-        '.jsx': 'jsx'
-    }
-    
-    result = language_map.get(suffix)
-    assert result is None or isinstance(result, str), "Invalid result"
+    suffix = os.path.splitext(file_path)[1].lower()
+    result = LANGUAGE_BY_EXTENSION.get(suffix)
     
+    assert result is None or isinstance(result, str), "Invalid result"
     return result
 
 
@@ -160,6 +205,20 @@ class CodeParser:
                 continue
 
 
+@lru_cache(maxsize=1)
+def get_code_parser() -> CodeParser:
+    """
+    Get process-wide CodeParser, built on first use.
+    
+    Preconditions: tree-sitter libraries available
+    Postconditions: returns the same CodeParser on every call
+    """
+    code_parser = CodeParser()
+    
+    assert len(code_parser.parsers) > 0, "No parsers initialized"
+    return code_parser
+
+
 def extract_function_name(node: 'Node', language: str) -> Optional[str]:
     """
     Extract function name from AST node.
@@ -170,27 +229,44 @@ def extract_function_name(node: 'Node', language: str) -> Optional[str]:
     if not TREE_SITTER_AVAILABLE:
         return None
     
-    assert node is not None, "Node cannot be None"
+    extractor = NAME_EXTRACTORS.get(language)
+    if extractor is None:
+        return None
+    
+    return extractor(node)
+
+
+def extract_python_function_name(node: 'Node') -> Optional[str]:
+    """
+    Extract function name from Python function_definition node.
+    
+    Preconditions: node is valid tree-sitter Node for Python
+    Postconditions: returns function name or None
+    """
+    name_node = node.child_by_field_name('name')
+    if name_node and name_node.type == 'identifier':
+        return name_node.text.decode('utf-8')
     
-    if language in ['typescript', 'tsx', 'javascript', 'jsx']:
-        return extract_js_function_name(node)
+    return None
+
+
+def extract_c_function_name(node: 'Node') -> Optional[str]:
+    """
+    Extract function name from C/C++ function_definition node.
     
-    name_patterns = {
-        'python': ['name'],
-        'c': ['declarator', 'function_declarator'],
-        'cpp': ['declarator', 'function_declarator']
-    }
+    Preconditions: node is valid tree-sitter Node for C or C++
+    Postconditions: returns function name or None
+    """
+    declarator = node.child_by_field_name('declarator')
+    if not declarator:
+        return None
     
-    patterns = name_patterns.get(language, [])
+    if declarator.type == 'identifier':
+        return declarator.text.decode('utf-8')
     
-    for pattern in patterns:
-        name_node = node.child_by_field_name(pattern)
-        if name_node:
-            if name_node.type == 'identifier':
-                return name_node.text.decode('utf-8')
-            child = name_node.child_by_field_name('declarator')
-            if child and child.type == 'identifier':
-                return child.text.decode('utf-8')
+    name_node = declarator.child_by_field_name('declarator')
+    if name_node and name_node.type == 'identifier':
+        return name_node.text.decode('utf-8')
     
     return None
 
@@ -202,8 +278,6 @@ def extract_js_function_name(node: 'Node') -> Optional[str]:
     Preconditions: node is valid tree-sitter Node for TS/JS
     Postconditions: returns function name or None
     """
-    assert node is not None, "Node cannot be None"
-    
     node_type = node.type
     
     if node_type == 'function_declaration':
@@ -213,39 +287,46 @@ def extract_js_function_name(node: 'Node') -> Optional[str]:
     
     elif node_type == 'method_definition':
         name_node = node.child_by_field_name('name')
-        if name_node:
-            if name_node.type == 'property_identifier':
-                return name_node.text.decode('utf-8')
-            elif name_node.type == 'identifier':
-                return name_node.text.decode('utf-8')
+        if name_node and name_node.type in JS_NAME_NODE_TYPES:
+            return name_node.text.decode('utf-8')
     
-    elif node_type in ['function', 'arrow_function']:
+    elif node_type in ('function', 'arrow_function'):
         parent = node.parent
         if parent:
-            if parent.type == 'variable_declarator':
+            parent_type = parent.type
+            if parent_type == 'variable_declarator':
                 name_node = parent.child_by_field_name('name')
                 if name_node and name_node.type == 'identifier':
                     return name_node.text.decode('utf-8')
-            elif parent.type == 'assignment_expression':
+            elif parent_type == 'assignment_expression':
                 left = parent.child_by_field_name('left')
                 if left:
-                    if left.type == 'identifier':
+                    left_type = left.type
+                    if left_type == 'identifier':
                         return left.text.decode('utf-8')
-                    elif left.type == 'member_expression':
+                    elif left_type == 'member_expression':
                         prop = left.child_by_field_name('property')
                         if prop and prop.type == 'property_identifier':
                             return prop.text.decode('utf-8')
-            elif parent.type == 'property_definition':
+            elif parent_type == 'property_definition':
                 name_node = parent.child_by_field_name('name')
-                if name_node:
-                    if name_node.type == 'property_identifier':
-                        return name_node.text.decode('utf-8')
-                    elif name_node.type == 'identifier':
-                        return name_node.text.decode('utf-8')
+                if name_node and name_node.type in JS_NAME_NODE_TYPES:
+                    return name_node.text.decode('utf-8')
     
     return None
 
 
+NAME_EXTRACTORS: Dict[str, Callable[['Node'], Optional[str]]] = {
+    'python': extract_python_function_name,
+    'c': extract_c_function_name,
+    'cpp': extract_c_function_name,
+    'typescript': extract_js_function_name,
+    'tsx': extract_js_function_name,
+    'javascript': extract_js_function_name,
+    'jsx': extract_js_function_name
+}
+
+
 def parse_file(file_path: str) -> List[FunctionInfo]:
     """
     Parse source file and extract function information.
@@ -263,57 +344,165 @@ def parse_file(file_path: str) -> List[FunctionInfo]:
     if not language:
         return []
     
-    content = path.read_text(encoding='utf-8')
-    functions = extract_functions(content, file_path, language)
+    content = normalize_newlines(path.read_bytes())
+    functions = extract_functions_by_content(content, file_path, language)
     
     assert isinstance(functions, list), "Result must be list"
     return functions
 
 
+def parse_file_with_hash(file_path: str) -> Tuple[List[FunctionInfo], str]:
+    """
+    Parse source file, also hashing the exact bytes that were parsed.
+    
+    Preconditions: file_path points to readable source file
+    Postconditions: returns FunctionInfo list and SHA-256 hex of the raw bytes read
+    """
+    assert file_path, "File path cannot be empty"
+    
+    raw = Path(file_path).read_bytes()
+    language = get_language_for_file(file_path)
+    functions = []
+    if language:
+        functions = extract_functions_by_content(normalize_newlines(raw), file_path, language)
+    content_hash = hashlib.sha256(raw).hexdigest()
+    
+    assert len(content_hash) == 64, "SHA-256 hash must be 64 chars"
+    return functions, content_hash
+
+
+def extract_functions_by_content(
+    content: bytes,
+    file_path: str,
+    language: str
+) -> List[FunctionInfo]:
+    """
+    Extract functions, reusing the result of an identical file parsed earlier.
+    
+    Preconditions: content is file bytes, language supported
+    Postconditions: returns fresh FunctionInfo list attributed to file_path;
+                    cache safe across threads
+    """
+    cache_key = (hashlib.sha256(content).digest(), language)
+    with _cache_lock:
+        cached = _content_cache.get(cache_key)
+        if cached is not None:
+            _content_cache.move_to_end(cache_key)
+    
+    if cached is None:
+        functions = extract_functions(content, file_path, language)
+        cached = [replace(func, calls=list(func.calls)) for func in functions]
+        with _cache_lock:
+            _content_cache[cache_key] = cached
+            if len(_content_cache) > CONTENT_CACHE_SIZE:
+                _content_cache.popitem(last=False)
+        return functions
+    
+    functions = [replace(func, file_path=file_path, calls=list(func.calls)) for func in cached]
+    
+    assert len(functions) == len(cached), "One copy per cached function"
+    return functions
+
+
+def normalize_newlines(source: bytes) -> bytes:
+    """
+    Translate CRLF and lone CR line endings to LF, as text-mode reads do.
+    
+    Preconditions: source is raw file content
+    Postconditions: returns content without carriage returns
+    """
+    if b'\r' not in source:
+        return source
+    
+    result = source.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    assert b'\r' not in result, "Carriage returns must be translated"
+    return result
+
+
+def parse_files(
+    file_paths: List[str],
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None
+) -> Dict[str, List[FunctionInfo]]:
+    """
+    Parse many source files, using a process pool for larger batches.
+    
+    Preconditions: file_paths is list of source file paths; callers running other
+                   threads pass a non-fork mp_context, since forking them can deadlock
+    Postconditions: returns FunctionInfo list for every path, in input order
+    """
+    assert workers is None or workers > 0, "Workers must be positive"
+    
+    return map_source_files(parse_file, file_paths, workers, mp_context)
+
+
+def parse_files_with_hash(
+    file_paths: List[str],
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None
+) -> Dict[str, Tuple[List[FunctionInfo], str]]:
+    """
+    Parse many source files like parse_files, pairing each result with its content hash.
+    
+    Preconditions: as for parse_files
+    Postconditions: returns (FunctionInfo list, SHA-256 hex of parsed bytes) per path
+    """
+    assert workers is None or workers > 0, "Workers must be positive"
+    
+    return map_source_files(parse_file_with_hash, file_paths, workers, mp_context)
+
+
+def map_source_files(
+    worker: Callable[[str], Any],
+    file_paths: List[str],
+    workers: Optional[int],
+    mp_context: Optional[BaseContext]
+) -> Dict[str, Any]:
+    """
+    Apply module-level worker to every path, in a process pool for larger batches.
+    
+    Preconditions: worker is picklable, file_paths is list of source file paths
+    Postconditions: returns worker result for every path, in input order
+    """
+    assert isinstance(file_paths, list), "File paths must be list"
+    
+    if len(file_paths) < PARALLEL_PARSE_MIN_FILES:
+        return {path: worker(path) for path in file_paths}
+    
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=mp_context) as executor:
+        parsed = executor.map(worker, file_paths, chunksize=PARALLEL_PARSE_CHUNKSIZE)
+        results = dict(zip(file_paths, parsed))
+    
+    assert len(results) == len(set(file_paths)), "One result per file"
+    return results
+
+
 def extract_functions(
-    code: str,
+    code: Union[str, bytes],
     file_path: str,
     language: str
 ) -> List[FunctionInfo]:
     """
     Extract all functions from code using tree-sitter.
     
-    Preconditions: code is valid source, language supported
+    Preconditions: code is valid source as str or UTF-8 bytes, language supported
     Postconditions: returns FunctionInfo for each function found
     """
     assert code is not None, "Code cannot be None"
-    assert language in ['python', 'c', 'cpp', 'typescript', 'tsx', 'javascript', 'jsx'], "Unsupported language"
+    assert language in FUNCTION_NODE_TYPES, "Unsupported language"
     
     if not TREE_SITTER_AVAILABLE:
         return []
     
     try:
-        code_parser = CodeParser()
-        parser = code_parser.parsers.get(language)
+        parser = get_code_parser().parsers.get(language)
         if not parser:
             return []
         
-        tree = parser.parse(bytes(code, 'utf-8'))
-        functions = []
-        
-        function_types = {
-            'python': 'function_definition',
-            'c': 'function_definition',
-            'cpp': 'function_definition',
-            'typescript': ['function_declaration', 'method_definition', 'function', 'arrow_function'],
-            'tsx': ['function_declaration', 'method_definition', 'function', 'arrow_function'],
-            'javascript': ['function_declaration', 'method_definition', 'function', 'arrow_function'],
-            'jsx': ['function_declaration', 'method_definition', 'function', 'arrow_function']
-        }
-        
-        target_types = function_types.get(language, [])
-        if isinstance(target_types, str):
-            target_types = [target_types]
-        
-        cursor = tree.walk()
-        
-        for target_type in target_types:
-            visit_nodes(cursor.node, target_type, functions, code, file_path, language)
+        source = code.encode('utf-8') if isinstance(code, str) else code
+        tree = parse_tree(parser, source, file_path, language)
+        functions = collect_functions(tree.root_node, file_path, language)
         
         assert isinstance(functions, list), "Result must be list"
         return functions
@@ -321,50 +510,190 @@ def extract_functions(
         return []
 
 
-def visit_nodes(
-    node: 'Node',
-    target_type: str,
-    functions: List[FunctionInfo],
-    code: str,
+def parse_tree(
+    parser: 'Parser',
+    source: bytes,
     file_path: str,
     language: str
-) -> None:
+) -> Any:
+    """
+    Parse source, reusing the previous tree for this file incrementally.
+    
+    Preconditions: parser matches language, source is file content bytes
+    Postconditions: returns tree for source; cache holds it for next reparse;
+                    cache safe across threads, each cached tree reused by one caller
+    """
+    assert parser is not None, "Parser required"
+    assert isinstance(source, bytes), "Source must be bytes"
+    
+    cache_key = (file_path, language)
+    with _cache_lock:
+        cached = _tree_cache.pop(cache_key, None)
+    
+    if cached is None:
+        tree = parser.parse(source)
+    elif cached[0] == source:
+        tree = cached[1]
+    else:
+        old_source, old_tree = cached
+        apply_source_edit(old_tree, old_source, source)
+        tree = parser.parse(source, old_tree)
+    
+    with _cache_lock:
+        _tree_cache[cache_key] = (source, tree)
+        if len(_tree_cache) > TREE_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+    
+    assert tree is not None, "Tree must be parsed"
+    return tree
+
+
+def apply_source_edit(tree: Any, old_source: bytes, new_source: bytes) -> None:
     """
-    Recursively visit AST nodes to find functions.
+    Describe the change between two sources as one edit on tree.
     
-    Preconditions: node is valid, functions list provided
-    Postconditions: functions list populated with found functions
+    Preconditions: tree was parsed from old_source
+    Postconditions: tree edited so that it can seed a reparse of new_source
     """
-    if node.type == target_type:
-        func_info = create_function_info(node, code, file_path, language)
-        if func_info:
-            functions.append(func_info)
+    assert tree is not None, "Tree required"
     
-    for child in node.children:
-        visit_nodes(child, target_type, functions, code, file_path, language)
+    limit = min(len(old_source), len(new_source))
+    start = longest_matching_length(
+        lambda length: old_source[:length] == new_source[:length],
+        limit
+    )
+    suffix = longest_matching_length(
+        lambda length: old_source[len(old_source) - length:] == new_source[len(new_source) - length:],
+        limit - start
+    )
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+    assert start <= old_end and start <= new_end, "Edit must not end before it starts"
+    
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=byte_to_point(old_source, start),
+        old_end_point=byte_to_point(old_source, old_end),
+        new_end_point=byte_to_point(new_source, new_end)
+    )
+
+
+def longest_matching_length(matches: Callable[[int], bool], limit: int) -> int:
+    """
+    Binary-search the largest length in [0, limit] for which matches holds.
+    
+    Preconditions: matches is monotone (true up to some length, then false)
+    Postconditions: returns largest matching length; comparisons run in C
+    """
+    assert limit >= 0, "Limit must be non-negative"
+    
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if matches(mid):
+            low = mid
+        else:
+            high = mid - 1
+    
+    assert 0 <= low <= limit, "Length must be within limit"
+    return low
+
+
+def byte_to_point(source: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Convert byte offset to tree-sitter (row, column) point.
+    
+    Preconditions: 0 <= offset <= len(source)
+    Postconditions: returns zero-based row and byte column
+    """
+    assert 0 <= offset <= len(source), "Offset must be within source"
+    
+    row = source.count(b'\n', 0, offset)
+    line_start = source.rfind(b'\n', 0, offset) + 1
+    
+    assert line_start <= offset, "Line must start at or before offset"
+    return (row, offset - line_start)
+
+
+def collect_functions(
+    root: 'Node',
+    file_path: str,
+    language: str
+) -> List[FunctionInfo]:
+    """
+    Find function nodes and their calls in a single TreeCursor pass.
+    
+    Preconditions: root is valid tree-sitter Node, language supported
+    Postconditions: returns FunctionInfo grouped by FUNCTION_NODE_TYPES order,
+                    document order within each type; each function's calls
+                    include those made by functions nested inside it
+    """
+    target_set = FUNCTION_NODE_TYPE_SETS[language]
+    matches: List[Tuple['Node', List[str]]] = []
+    open_functions: List[Tuple[int, List[str]]] = []
+    cursor = root.walk()
+    goto_first_child = cursor.goto_first_child
+    goto_next_sibling = cursor.goto_next_sibling
+    goto_parent = cursor.goto_parent
+    depth = 0
+    
+    while True:
+        node = cursor.node
+        node_type = node.type
+        while open_functions and open_functions[-1][0] >= depth:
+            open_functions.pop()
+        
+        if node_type in target_set:
+            calls: List[str] = []
+            matches.append((node, calls))
+            open_functions.append((depth, calls))
+        elif open_functions and node_type in CALL_NODE_TYPES:
+            call_name = extract_node_call(node)
+            if call_name:
+                for _, enclosing_calls in open_functions:
+                    enclosing_calls.append(call_name)
+        
+        if goto_first_child():
+            depth += 1
+            continue
+        while not goto_next_sibling() and goto_parent():
+            depth -= 1
+        if depth == 0:
+            break
+    
+    type_rank = FUNCTION_NODE_TYPE_RANKS[language]
+    matches.sort(key=lambda match: type_rank[match[0].type])
+    
+    extract_name = NAME_EXTRACTORS[language]
+    functions = []
+    for node, calls in matches:
+        name = extract_name(node)
+        if name:
+            functions.append(create_function_info(node, name, file_path, calls))
+    
+    assert len(functions) <= len(matches), "At most one function per match"
+    return functions
 
 
 def create_function_info(
     node: 'Node',
-    code: str,
+    name: str,
     file_path: str,
-    language: str
-) -> Optional[FunctionInfo]:
+    calls: List[str]
+) -> FunctionInfo:
     """
     Create FunctionInfo from AST node.
     
-    Preconditions: node represents function definition
-    Postconditions: returns FunctionInfo or None if extraction fails
+    Preconditions: node represents function named name, calls found in its subtree
+    Postconditions: returns FunctionInfo spanning node
     """
-    name = extract_function_name(node, language)
-    if not name:
-        return None
-    
     start_line = node.start_point[0] + 1
     end_line = node.end_point[0] + 1
-    body = node.text.decode('utf-8')
-    code_hash = compute_code_hash(body)
-    calls = extract_function_calls(node)
+    raw = node.text
+    code_hash = compute_code_hash(raw)
+    body = raw.decode('utf-8')
     
     return FunctionInfo(
         name=name,
@@ -377,51 +706,31 @@ def create_function_info(
     )
 
 
-def extract_function_calls(node: 'Node') -> List[str]:
+def extract_node_call(node: 'Node') -> Optional[str]:
     """
-    Extract function call names from AST node.
+    Extract called name if node is a call site.
     
     Preconditions: node is valid tree-sitter Node
-    Postconditions: returns list of called function names
-    """
-    calls = []
-    collect_calls(node, calls)
-    
-    assert isinstance(calls, list), "Calls must be list"
-    return calls
-
-
-def collect_calls(node: 'Node', calls: List[str]) -> None:
+    Postconditions: returns called function name, or None for other nodes
     """
-    Recursively collect function calls.
-    
-    Preconditions: node is valid tree-sitter Node
-    Postconditions: calls list populated with function names
-    """
-    assert node is not None, "Node cannot be None"
-    assert isinstance(calls, list), "Calls must be list"
+    node_type = node.type
     
-    if node.type == 'call':
+    if node_type == 'call':
         func_node = node.child_by_field_name('function')
         if func_node and func_node.type == 'identifier':
-            calls.append(func_node.text.decode('utf-8'))
+            return func_node.text.decode('utf-8')
     
-    elif node.type == 'call_expression':
+    elif node_type == 'call_expression':
         func_node = node.child_by_field_name('function')
         if func_node:
-            call_name = extract_call_name(func_node)
-            if call_name:
-                calls.append(call_name)
+            return extract_call_name(func_node)
     
-    elif node.type == 'new_expression':
+    elif node_type == 'new_expression':
         constructor_node = node.child_by_field_name('constructor')
         if constructor_node:
-            call_name = extract_call_name(constructor_node)
-            if call_name:
-                calls.append(call_name)
+            return extract_call_name(constructor_node)
     
-    for child in node.children:
-        collect_calls(child, calls)
+    return None
 
 
 def extract_call_name(node: 'Node') -> Optional[str]:
@@ -431,12 +740,12 @@ def extract_call_name(node: 'Node') -> Optional[str]:
     Preconditions: node is valid tree-sitter Node
     Postconditions: returns function name or None
     """
-    assert node is not None, "Node cannot be None"
+    node_type = node.type
     
-    if node.type == 'identifier':
+    if node_type == 'identifier':
         return node.text.decode('utf-8')
     
-    elif node.type == 'member_expression':
+    elif node_type == 'member_expression':
         property_node = node.child_by_field_name('property')
         if property_node and property_node.type == 'property_identifier':
             return property_node.text.decode('utf-8')
@@ -5,29 +5,55 @@ Demo script showing the abstraction tracking system in action.
 Run this to see a complete workflow demonstration.
 """
 
+import io
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import List
 
+from cli.main import main as cli_main
 
-def run_command(cmd: str, description: str) -> None:
+
+def run_cli_step(argv: List[str], description: str) -> None:
+    """
+    Run CLI command in-process and display its output.
+    
+    Preconditions: argv is CLI argument list without program name
+    Postconditions: command executed, output displayed
+    """
+    assert argv, "Arguments cannot be empty"
+    assert description, "Description required"
+    
+    print_step_header(f"python -m cli.main {' '.join(argv)}", description)
+    
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        exit_code = cli_main(argv)
+    
+    if buffer.getvalue():
+        print(buffer.getvalue())
+    
+    if exit_code != 0:
+        print(f"Error: command exited with status {exit_code}")
+    
+    assert isinstance(exit_code, int), "Exit code must be int"
+
+
+def run_command(cmd: List[str], description: str) -> None:
     """
-    Execute command and display result.
+    Execute command in a subprocess and display result.
     
-    Preconditions: cmd is valid shell command
+    Preconditions: cmd is argument list for an executable
     Postconditions: command executed, output displayed
     """
     assert cmd, "Command cannot be empty"
     assert description, "Description required"
     
-    print(f"\n{'='*70}")
-    print(f"Step: {description}")
-    print(f"Command: {cmd}")
-    print(f"{'='*70}")
+    print_step_header(' '.join(cmd), description)
     
     result = subprocess.run(
         cmd,
-        shell=True,
         capture_output=True,
         text=True
     )
@@ -41,6 +67,22 @@ def run_command(cmd: str, description: str) -> None:
     assert isinstance(result.returncode, int), "Return code must be int"
 
 
+def print_step_header(command: str, description: str) -> None:
+    """
+    Print banner for a demo step.
+    
+    Preconditions: command and description are non-empty
+    Postconditions: banner printed to stdout
+    """
+    assert command, "Command required"
+    assert description, "Description required"
+    
+    print(f"\n{'='*70}")
+    print(f"Step: {description}")
+    print(f"Command: {command}")
+    print(f"{'='*70}")
+
+
 def main() -> int:
     """
     Run complete demonstration.
@@ -53,35 +95,23 @@ def main() -> int:
     
     project_dir = Path(__file__).parent
     
-    steps = [
-        (
-            "python -m cli.main init .",
-            "Initialize abstraction tracking"
-        ),
-        (
-            "python -m cli.main index examples/",
-            "Index example Python code"
-        ),
-        (
-            "python -m cli.main graph",
-            "View call graph"
-        ),
-        (
-            "python -m cli.main check examples/",
-            "Check for changes (none expected)"
-        ),
-        (
-            "python -m pytest tests/ -v --tb=line -q",
-            "Run test suite"
-        ),
+    cli_steps = [
+        (["init", "."], "Initialize abstraction tracking"),
+        (["index", "examples/"], "Index example Python code"),
+        (["graph"], "View call graph"),
+        (["check", "examples/"], "Check for changes (none expected)"),
     ]
     
-    for cmd, desc in steps:
-        try:
-            run_command(cmd, desc)
-        except Exception as e:
-            print(f"Error in step: {e}")
-            return 1
+    try:
+        for argv, desc in cli_steps:
+            run_cli_step(argv, desc)
+        run_command(
+            [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=line", "-q"],
+            "Run test suite"
+        )
+    except Exception as e:
+        print(f"Error in step: {e}")
+        return 1
     
     print("\n" + "="*70)
     print("Demo completed successfully!")
@@ -128,17 +128,32 @@ export async function setWorkspace(
   return response.json();
 }
 
-export async function indexWorkspace(): Promise<{
+interface IndexResult {
   success: boolean;
   count?: number;
   message?: string;
   error?: string;
-}> {
+  job_id?: string;
+  done?: boolean;
+}
+
+const INDEX_POLL_INTERVAL_MS = 500;
+
+export async function indexWorkspace(): Promise<IndexResult> {
   const response = await fetch(`${API_BASE_URL}/api/index`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
     },
   });
-  return response.json();
+  let data: IndexResult = await response.json();
+
+  while (data.success && data.job_id && !data.done) {
+    await new Promise((resolve) => setTimeout(resolve, INDEX_POLL_INTERVAL_MS));
+    const status = await fetch(
+      `${API_BASE_URL}/api/index/status/${data.job_id}`
+    );
+    data = await status.json();
+  }
+  return data;
 }
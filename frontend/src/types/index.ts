@@ -45,6 +45,7 @@ export interface FunctionCode {
   function_name: string;
   graph_callers?: string[];
   graph_callees?: string[];
+  truncated?: boolean;
 }
 
 export interface FunctionContract {
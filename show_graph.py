@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Show graph visualization example."""
 
+import io
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from storage.database import ContractDatabase, load_call_graph
 from core.call_graph import find_entry_points
@@ -10,6 +13,13 @@ from visualization.graph_viewer import (
 )
 
 def main():
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        print_report()
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+def print_report():
     storage_dir = str(Path.cwd() / ".abstraction")
     db = ContractDatabase(storage_dir)
     graph = load_call_graph(db)
@@ -1,12 +1,32 @@
 """Metadata storage and retrieval."""
 
+import dataclasses
 import json
+import mmap
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+ORJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from core.contract import FunctionContract, AbstractionLevel
-from core.call_graph import CallGraph, CallGraphNode
+from core.call_graph import CallGraph, CallGraphNode, create_function_key
+from core.change_detector import ChangeDetector
+
+
+CONTRACT_JOURNAL_COMPACT_BYTES = 1024 * 1024
+CALL_GRAPH_FORMAT_VERSION = 2
+
+LEVEL_BY_VALUE: Dict[str, AbstractionLevel] = {level.value: level for level in AbstractionLevel}
 
 
 class ContractDatabase:
@@ -14,7 +34,7 @@ class ContractDatabase:
     Persistent storage for function contracts and metadata.
     
     Preconditions: storage_path is valid directory
-    Postconditions: provides CRUD operations for contracts
+    Postconditions: provides CRUD operations for contracts; safe to share across threads
     """
     
     def __init__(self, storage_path: str) -> None:
@@ -29,6 +49,13 @@ class ContractDatabase:
         self.storage_path = Path(storage_path)
         self.contracts_file = self.storage_path / "contracts.json"
         self.graph_file = self.storage_path / "call_graph.json"
+        self.baseline_file = self.storage_path / "baseline.json"
+        self.journal_file = self.storage_path / "contracts.journal.jsonl"
+        self._contracts_cache: Optional[Dict] = None
+        self._contracts_stat: Optional[Tuple] = None
+        self._graph_cache: Optional[CallGraph] = None
+        self._graph_stat: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
         
         initialize_storage(self.storage_path)
         
@@ -49,6 +76,61 @@ def initialize_storage(path: Path) -> None:
     assert path.exists(), "Directory must be created"
 
 
+def encode_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when installed.
+    
+    Preconditions: data holds only JSON-compatible values with str keys
+    Postconditions: returns encoded bytes, two-space indented if requested
+    """
+    assert isinstance(indent, bool), "Indent must be bool"
+    
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        result = orjson.dumps(data, option=option)
+    else:
+        content = json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+        result = content.encode('utf-8')
+    
+    assert isinstance(result, bytes), "Result must be bytes"
+    return result
+
+
+def decode_json(content: Union[str, bytes]) -> Any:
+    """
+    Parse JSON document, using orjson when installed.
+    
+    Preconditions: content is JSON text or its UTF-8 bytes
+    Postconditions: returns decoded value
+    """
+    assert isinstance(content, (str, bytes)), "Content must be str or bytes"
+    
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    
+    return json.loads(content)
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Parse JSON file, decoding straight from a read-only mapping when orjson is available.
+    
+    Preconditions: path exists
+    Postconditions: returns decoded value, or None for an empty file
+    """
+    assert path is not None, "Path required"
+    
+    with path.open('rb') as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return None
+        if not ORJSON_AVAILABLE:
+            return json.loads(handle.read())
+        
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
 def save_contract(db: ContractDatabase, contract: FunctionContract) -> None:
     """
     Save or update contract in database.
@@ -59,13 +141,14 @@ def save_contract(db: ContractDatabase, contract: FunctionContract) -> None:
     assert db is not None, "Database required"
     assert contract is not None, "Contract required"
     
-    contracts = load_all_contracts(db)
     key = create_contract_key(contract)
-    contracts[key] = contract_to_dict(contract)
+    entry = {'op': 'put', 'key': key, 'value': contract_to_dict(contract)}
     
-    write_contracts_file(db, contracts)
+    with db._lock:
+        contracts = load_all_contracts(db)
+        append_contract_journal(db, contracts, entry)
     
-    assert key in load_all_contracts(db), "Contract must be saved"
+    assert key in contracts, "Contract must be saved"
 
 
 def create_contract_key(contract: FunctionContract) -> str:
@@ -78,7 +161,7 @@ def create_contract_key(contract: FunctionContract) -> str:
     assert contract.name, "Name required"
     assert contract.file_path, "File path required"
     
-    key = f"{contract.file_path}::{contract.name}"
+    key = create_function_key(contract.name, contract.file_path)
     
     assert "::" in key, "Key must contain separator"
     return key
@@ -89,7 +172,7 @@ def contract_to_dict(contract: FunctionContract) -> Dict:
     Convert contract to dictionary for serialization.
     
     Preconditions: contract is valid FunctionContract
-    Postconditions: returns serializable dictionary
+    Postconditions: returns serializable dictionary sharing no lists or dicts with contract
     """
     assert contract is not None, "Contract required"
     
@@ -97,15 +180,15 @@ def contract_to_dict(contract: FunctionContract) -> Dict:
         'name': contract.name,
         'file_path': contract.file_path,
         'line_number': contract.line_number,
-        'preconditions': contract.preconditions,
-        'postconditions': contract.postconditions,
+        'preconditions': list(contract.preconditions),
+        'postconditions': list(contract.postconditions),
         'input_prediction': contract.input_prediction,
         'output_prediction': contract.output_prediction,
         'expected_behavior': contract.expected_behavior,
         'abstraction_level': contract.abstraction_level.value,
         'code_hash': contract.code_hash,
         'last_verified': contract.last_verified,
-        'metadata': contract.metadata
+        'metadata': dict(contract.metadata)
     }
     
     assert isinstance(data, dict), "Result must be dict"
@@ -117,7 +200,7 @@ def dict_to_contract(data: Dict) -> FunctionContract:
     Convert dictionary to FunctionContract.
     
     Preconditions: data contains required fields
-    Postconditions: returns valid FunctionContract
+    Postconditions: returns valid FunctionContract sharing no lists or dicts with data
     """
     assert 'name' in data, "Name required in data"
     assert 'file_path' in data, "File path required"
@@ -126,56 +209,183 @@ def dict_to_contract(data: Dict) -> FunctionContract:
         name=data['name'],
         file_path=data['file_path'],
         line_number=data['line_number'],
-        preconditions=data.get('preconditions', []),
-        postconditions=data.get('postconditions', []),
+        preconditions=list(data.get('preconditions', [])),
+        postconditions=list(data.get('postconditions', [])),
         input_prediction=data.get('input_prediction', ''),
         output_prediction=data.get('output_prediction', ''),
         expected_behavior=data.get('expected_behavior', ''),
-        abstraction_level=AbstractionLevel(
+        abstraction_level=parse_abstraction_level(
             data.get('abstraction_level', 'medium')
         ),
         code_hash=data.get('code_hash', ''),
         last_verified=data.get('last_verified'),
-        metadata=data.get('metadata', {})
+        metadata=dict(data.get('metadata', {}))
     )
     
     assert contract.name == data['name'], "Name must match"
     return contract
 
 
+def parse_abstraction_level(value: str) -> AbstractionLevel:
+    """
+    Map stored level value to AbstractionLevel member.
+    
+    Preconditions: value is an AbstractionLevel value
+    Postconditions: returns matching member, raises ValueError otherwise
+    """
+    level = LEVEL_BY_VALUE.get(value)
+    if level is None:
+        level = AbstractionLevel(value)
+    
+    assert level.value == value, "Level must match stored value"
+    return level
+
+
 def load_all_contracts(db: ContractDatabase) -> Dict:
     """
-    Load all contracts from storage.
+    Load all contracts: snapshot file plus replayed journal, cached while unchanged.
     
     Preconditions: db initialized
-    Postconditions: returns dictionary of all contracts
+    Postconditions: returns dictionary of all contracts, shared with db cache
     """
     assert db is not None, "Database required"
     
-    if not db.contracts_file.exists():
-        return {}
-    
-    content = db.contracts_file.read_text(encoding='utf-8')
-    contracts = json.loads(content) if content else {}
+    with db._lock:
+        file_stat = contracts_stat_signature(db)
+        if db._contracts_cache is not None and db._contracts_stat == file_stat:
+            return db._contracts_cache
+        
+        contracts = {}
+        if file_stat[0] is not None:
+            contracts = read_json_file(db.contracts_file) or {}
+        if file_stat[1] is not None:
+            replay_contract_journal(db.journal_file.read_bytes(), contracts)
+        
+        db._contracts_cache = contracts
+        db._contracts_stat = file_stat
     
     assert isinstance(contracts, dict), "Contracts must be dict"
     return contracts
 
 
+def contracts_stat_signature(db: ContractDatabase) -> Tuple:
+    """
+    Identify current versions of contracts snapshot and journal.
+    
+    Preconditions: db initialized
+    Postconditions: returns (snapshot signature, journal signature), None for missing
+    """
+    assert db is not None, "Database required"
+    
+    return (stat_signature(db.contracts_file), stat_signature(db.journal_file))
+
+
+def stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read modification time and size identifying a file version.
+    
+    Preconditions: path is valid Path
+    Postconditions: returns (mtime_ns, size), or None if file missing
+    """
+    assert path is not None, "Path required"
+    
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError:
+        return None
+    
+    assert file_stat.st_size >= 0, "Size must be non-negative"
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def replay_contract_journal(content: bytes, contracts: Dict) -> None:
+    """
+    Apply journaled puts and deletes on top of snapshot contracts.
+    
+    Preconditions: content is journal file bytes, one JSON entry per line
+    Postconditions: contracts reflects every complete journal entry in order
+    """
+    assert isinstance(content, bytes), "Journal content must be bytes"
+    assert isinstance(contracts, dict), "Contracts must be dict"
+    
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = decode_json(line)
+        except ValueError:
+            continue
+        apply_journal_entry(contracts, entry)
+
+
+def apply_journal_entry(contracts: Dict, entry: Dict) -> None:
+    """
+    Apply single journal entry to contracts.
+    
+    Preconditions: entry has 'op' of put or delete and 'key'
+    Postconditions: key set to entry value, or removed
+    """
+    assert entry['op'] in ('put', 'delete'), "Unknown journal operation"
+    
+    if entry['op'] == 'put':
+        contracts[entry['key']] = entry['value']
+    else:
+        contracts.pop(entry['key'], None)
+
+
+def append_contract_journal(db: ContractDatabase, contracts: Dict, entry: Dict) -> None:
+    """
+    Persist one contract change by appending it to the journal.
+    
+    Preconditions: contracts is current result of load_all_contracts(db), db lock held
+    Postconditions: entry durable in journal and applied to cached contracts;
+                    journal compacted into snapshot once over size threshold
+    """
+    assert db is not None, "Database required"
+    
+    db._contracts_cache = None
+    with db.journal_file.open('ab') as journal:
+        journal.write(encode_json(entry) + b'\n')
+    
+    apply_journal_entry(contracts, entry)
+    db._contracts_cache = contracts
+    db._contracts_stat = contracts_stat_signature(db)
+    
+    if db._contracts_stat[1][1] > CONTRACT_JOURNAL_COMPACT_BYTES:
+        compact_contracts(db)
+
+
+def compact_contracts(db: ContractDatabase) -> None:
+    """
+    Fold the journal into the contracts snapshot.
+    
+    Preconditions: db initialized
+    Postconditions: snapshot holds all contracts, journal removed
+    """
+    contracts = load_all_contracts(db)
+    write_contracts_file(db, contracts)
+    
+    assert not db.journal_file.exists(), "Journal must be folded into snapshot"
+
+
 def write_contracts_file(db: ContractDatabase, contracts: Dict) -> None:
     """
-    Write contracts to file.
+    Write contracts snapshot, superseding the journal.
     
     Preconditions: db initialized, contracts valid dict
-    Postconditions: contracts persisted to file
+    Postconditions: contracts persisted to snapshot file, journal removed
     """
     assert db is not None, "Database required"
     assert isinstance(contracts, dict), "Contracts must be dict"
     
-    content = json.dumps(contracts, indent=2)
-    db.contracts_file.write_text(content, encoding='utf-8')
+    db._contracts_cache = None
+    write_file_atomic(db.contracts_file, encode_json(contracts, indent=True))
+    if db.journal_file.exists():
+        db.journal_file.unlink()
+    db._contracts_cache = contracts
+    db._contracts_stat = contracts_stat_signature(db)
     
-    assert db.contracts_file.exists(), "File must exist after write"
+    assert db._contracts_stat[0] is not None, "Snapshot must exist after write"
 
 
 def get_contract(
@@ -193,7 +403,7 @@ def get_contract(
     assert file_path, "File path required"
     
     contracts = load_all_contracts(db)
-    key = f"{file_path}::{function_name}"
+    key = create_function_key(function_name, file_path)
     
     if key not in contracts:
         return None
@@ -201,6 +411,104 @@ def get_contract(
     return dict_to_contract(contracts[key])
 
 
+def contract_exists(
+    db: ContractDatabase,
+    function_name: str,
+    file_path: str
+) -> bool:
+    """
+    Check whether a contract is stored without decoding it.
+    
+    Preconditions: db initialized, names provided
+    Postconditions: returns True if a contract exists for the function
+    """
+    assert function_name, "Function name required"
+    assert file_path, "File path required"
+    
+    return create_function_key(function_name, file_path) in load_all_contracts(db)
+
+
+class LazyContract:
+    """
+    Read-only view of a stored contract that decodes fields on access.
+    
+    Preconditions: data is a contract record from load_all_contracts
+    Postconditions: attributes mirror FunctionContract without building one
+    """
+    
+    __slots__ = ('data',)
+    
+    def __init__(self, data: Dict) -> None:
+        """
+        Wrap stored contract record.
+        
+        Preconditions: data contains name and file_path
+        Postconditions: view ready, no fields decoded yet
+        """
+        assert 'name' in data, "Name required in data"
+        assert 'file_path' in data, "File path required"
+        
+        self.data = data
+    
+    def __getattr__(self, name: str) -> Any:
+        """Decode a single FunctionContract field from the stored record."""
+        assert name != 'data', "Record must be set before fields are read"
+        
+        if name == 'abstraction_level':
+            return parse_abstraction_level(self.data.get('abstraction_level', 'medium'))
+        if name in LAZY_CONTRACT_DEFAULTS:
+            return self.data.get(name, LAZY_CONTRACT_DEFAULTS[name]())
+        if name in ('name', 'file_path', 'line_number'):
+            return self.data[name]
+        raise AttributeError(name)
+
+
+def contract_field_defaults() -> Dict[str, Any]:
+    """
+    Map optional FunctionContract fields to factories for their defaults.
+    
+    Preconditions: none
+    Postconditions: returns factory per defaulted field except abstraction_level
+    """
+    assert dataclasses.is_dataclass(FunctionContract), "FunctionContract must be dataclass"
+    
+    defaults = {}
+    for contract_field in dataclasses.fields(FunctionContract):
+        if contract_field.name == 'abstraction_level':
+            continue
+        if contract_field.default_factory is not dataclasses.MISSING:
+            defaults[contract_field.name] = contract_field.default_factory
+        elif contract_field.default is not dataclasses.MISSING:
+            defaults[contract_field.name] = lambda value=contract_field.default: value
+    
+    assert 'abstraction_level' not in defaults, "Level decoded separately"
+    return defaults
+
+
+LAZY_CONTRACT_DEFAULTS = contract_field_defaults()
+
+
+def get_contract_view(
+    db: ContractDatabase,
+    function_name: str,
+    file_path: str
+) -> Optional[LazyContract]:
+    """
+    Retrieve read-only contract view without building a FunctionContract.
+    
+    Preconditions: db initialized, names provided
+    Postconditions: returns LazyContract or None; use get_contract to modify
+    """
+    assert function_name, "Function name required"
+    assert file_path, "File path required"
+    
+    data = load_all_contracts(db).get(create_function_key(function_name, file_path))
+    if data is None:
+        return None
+    
+    return LazyContract(data)
+
+
 def delete_contract(
     db: ContractDatabase,
     function_name: str,
@@ -209,21 +517,20 @@ def delete_contract(
     """
     Delete contract from database.
     
-    Preconditions: db initialized
+    Preconditions: db initialized, names provided
     Postconditions: contract removed if existed, returns success
     """
     assert function_name, "Function name required"
+    assert file_path, "File path required"
     
-    contracts = load_all_contracts(db)
-    key = f"{file_path}::{function_name}"
-    
-    if key not in contracts:
-        return False
-    
-    del contracts[key]
-    write_contracts_file(db, contracts)
+    key = create_function_key(function_name, file_path)
+    with db._lock:
+        contracts = load_all_contracts(db)
+        if key not in contracts:
+            return False
+        append_contract_journal(db, contracts, {'op': 'delete', 'key': key})
     
-    assert key not in load_all_contracts(db), "Contract must be deleted"
+    assert key not in contracts, "Contract must be deleted"
     return True
 
 
@@ -238,32 +545,56 @@ def save_call_graph(db: ContractDatabase, graph: CallGraph) -> None:
     assert graph is not None, "Graph required"
     
     graph_data = serialize_call_graph(graph)
-    content = json.dumps(graph_data, indent=2)
-    db.graph_file.write_text(content, encoding='utf-8')
+    write_file_atomic(db.graph_file, encode_json(graph_data))
     
     assert db.graph_file.exists(), "Graph file must exist"
 
 
-def serialize_call_graph(graph: CallGraph) -> Dict:
+def write_file_atomic(path: Path, content: bytes) -> None:
     """
-    Convert call graph to serializable format.
+    Write file contents in a single all-or-nothing commit.
     
-    Preconditions: graph is valid CallGraph
-    Postconditions: returns dictionary representation
+    Preconditions: path parent directory exists, content is bytes
+    Postconditions: path holds content; readers never see a partial write
     """
-    nodes = {}
+    assert path is not None, "Path required"
+    assert isinstance(content, bytes), "Content must be bytes"
     
-    for name, node in graph.nodes.items():
-        nodes[name] = {
-            'function_name': node.function_name,
-            'file_path': node.file_path,
-            'line_number': node.line_number,
-            'callers': list(node.callers),
-            'callees': list(node.callees)
-        }
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def serialize_call_graph(graph: CallGraph) -> Dict:
+    """
+    Convert call graph to columnar serializable format.
     
-    assert isinstance(nodes, dict), "Result must be dict"
-    return {'nodes': nodes}
+    Preconditions: graph is valid CallGraph with mirrored callers/callees
+    Postconditions: returns per-field arrays indexed by node position;
+                    callees stored as node indices, callers rebuilt on load
+    """
+    keys = list(graph.nodes)
+    index = {key: position for position, key in enumerate(keys)}
+    files: Dict[str, int] = {}
+    names, file_ids, lines, callees = [], [], [], []
+    
+    for key in keys:
+        node = graph.nodes[key]
+        names.append(node.function_name)
+        file_ids.append(files.setdefault(node.file_path, len(files)))
+        lines.append(node.line_number)
+        callees.append(sorted(index[callee] for callee in node.callees))
+    
+    assert len(names) == len(keys), "One row per node"
+    return {
+        'version': CALL_GRAPH_FORMAT_VERSION,
+        'keys': keys,
+        'names': names,
+        'files': list(files),
+        'file_ids': file_ids,
+        'lines': lines,
+        'callees': callees
+    }
 
 
 def load_call_graph(db: ContractDatabase) -> Optional[CallGraph]:
@@ -278,41 +609,154 @@ def load_call_graph(db: ContractDatabase) -> Optional[CallGraph]:
     if not db.graph_file.exists():
         return None
     
-    content = db.graph_file.read_text(encoding='utf-8')
-    if not content:
+    graph_data = read_json_file(db.graph_file)
+    if not graph_data:
         return None
     
-    graph_data = json.loads(content)
+    if graph_data.get('version') == CALL_GRAPH_FORMAT_VERSION:
+        return columns_to_call_graph(graph_data)
     
-    from core.call_graph import CallGraph, CallGraphNode
-    from core.parser import FunctionInfo
+    return legacy_nodes_to_call_graph(graph_data.get('nodes', {}))
+
+
+def load_shared_call_graph(db: ContractDatabase) -> Optional[CallGraph]:
+    """
+    Load call graph, reusing db's copy while call_graph.json is unchanged.
     
+    Preconditions: db initialized, callers treat returned graph as read-only
+    Postconditions: returns CallGraph shared across calls, or None if not found
+    """
+    assert db is not None, "Database required"
+    
+    with db._lock:
+        graph_stat = stat_signature(db.graph_file)
+        if graph_stat is not None and graph_stat == db._graph_stat:
+            return db._graph_cache
+        
+        graph = load_call_graph(db)
+        db._graph_cache = graph
+        db._graph_stat = graph_stat
+    
+    assert graph is None or isinstance(graph, CallGraph), "Result must be graph or None"
+    return graph
+
+
+def shared_call_graph_signature(db: ContractDatabase) -> Optional[Tuple[int, int]]:
+    """
+    Identify the graph version last returned by load_shared_call_graph.
+    
+    Preconditions: db initialized
+    Postconditions: returns call_graph.json (mtime_ns, size) at that load, or None
+    """
+    assert db is not None, "Database required"
+    
+    return db._graph_stat
+
+
+def columns_to_call_graph(graph_data: Dict) -> CallGraph:
+    """
+    Rebuild call graph from columnar format.
+    
+    Preconditions: graph_data produced by serialize_call_graph
+    Postconditions: returns graph with interned keys and mirrored edges
+    """
+    keys = [sys.intern(key) for key in graph_data['keys']]
+    files = graph_data['files']
     graph = CallGraph()
     
-    if 'nodes' not in graph_data:
-        return graph
+    rows = zip(keys, graph_data['names'], graph_data['file_ids'], graph_data['lines'])
+    for key, name, file_id, line in rows:
+        graph.nodes[key] = CallGraphNode(
+            function_name=name,
+            file_path=files[file_id],
+            line_number=line
+        )
     
-    from core.call_graph import create_function_key
+    for key, callee_ids in zip(keys, graph_data['callees']):
+        callees = graph.nodes[key].callees
+        for callee_id in callee_ids:
+            callee = keys[callee_id]
+            callees.add(callee)
+            graph.nodes[callee].callers.add(key)
     
-    for key, node_data in graph_data['nodes'].items():
+    assert len(graph.nodes) == len(set(keys)), "One node per key"
+    return graph
+
+
+def legacy_nodes_to_call_graph(nodes: Dict) -> CallGraph:
+    """
+    Rebuild call graph from the older per-node format.
+    
+    Preconditions: nodes maps keys to node dicts with caller/callee lists
+    Postconditions: returns graph with interned keys
+    """
+    assert isinstance(nodes, dict), "Nodes must be dict"
+    
+    graph = CallGraph()
+    
+    for key, node_data in nodes.items():
         node = CallGraphNode(
             function_name=node_data['function_name'],
             file_path=node_data['file_path'],
             line_number=node_data['line_number']
         )
-        node.callers = set(node_data.get('callers', []))
-        node.callees = set(node_data.get('callees', []))
+        node.callers = set(map(sys.intern, node_data.get('callers', [])))
+        node.callees = set(map(sys.intern, node_data.get('callees', [])))
         
-        graph_key = key
+        graph_key = sys.intern(key)
         if "::" not in key:
             graph_key = create_function_key(node_data['function_name'], node_data['file_path'])
         
         graph.nodes[graph_key] = node
-        graph.graph.add_node(graph_key, data=node)
-    
-    for key, node in graph.nodes.items():
-        for callee_key in node.callees:
-            if callee_key in graph.nodes:
-                graph.graph.add_edge(key, callee_key)
     
+    assert len(graph.nodes) <= len(nodes), "At most one node per record"
     return graph
+
+
+def save_baseline(db: ContractDatabase, detector: ChangeDetector) -> None:
+    """
+    Persist change-detection baseline.
+    
+    Preconditions: db initialized, detector has recorded baseline
+    Postconditions: baseline saved to file
+    """
+    assert db is not None, "Database required"
+    assert detector is not None, "Detector required"
+    
+    functions = {
+        key: {
+            'name': detector.baseline_names[key],
+            'code_hash': code_hash
+        }
+        for key, code_hash in detector.baseline.items()
+    }
+    write_file_atomic(db.baseline_file, encode_json({'functions': functions}))
+    
+    assert db.baseline_file.exists(), "Baseline file must exist"
+
+
+def load_baseline(db: ContractDatabase) -> Optional[ChangeDetector]:
+    """
+    Load change-detection baseline from storage.
+    
+    Preconditions: db initialized
+    Postconditions: returns detector with baseline, or None if not recorded
+    """
+    assert db is not None, "Database required"
+    
+    if not db.baseline_file.exists():
+        return None
+    
+    baseline_data = read_json_file(db.baseline_file)
+    functions = baseline_data.get('functions', {}) if baseline_data else {}
+    if not functions:
+        return None
+    
+    detector = ChangeDetector()
+    for key, entry in functions.items():
+        detector.baseline[key] = entry['code_hash']
+        detector.baseline_names[key] = entry['name']
+        detector.function_locations[entry['name']] = key.rsplit('::', 1)[0]
+    
+    assert len(detector.baseline) > 0, "Baseline must have entries"
+    return detector
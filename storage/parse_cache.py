@@ -0,0 +1,224 @@
+"""Persistent cache of parsed functions per source file."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.parser import FunctionInfo
+from storage.database import (
+    initialize_storage,
+    write_file_atomic,
+    encode_json,
+    read_json_file
+)
+
+
+PARSE_CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    On-disk cache of parse results keyed by path, validated by stat then content hash.
+    
+    Preconditions: storage_path is valid directory path
+    Postconditions: entries loaded from disk, empty if missing or stale
+    """
+    
+    def __init__(self, storage_path: str) -> None:
+        """
+        Load parse cache from storage path.
+        
+        Preconditions: storage_path is valid path string
+        Postconditions: entries populated from cache file when compatible
+        """
+        assert storage_path, "Storage path required"
+        
+        self.storage_path = Path(storage_path)
+        self.cache_file = self.storage_path / "parse_cache.json"
+        self.entries: Dict[str, Dict] = load_cache_entries(self.cache_file)
+        self.dirty = False
+        
+        assert isinstance(self.entries, dict), "Entries must be dict"
+
+
+def load_cache_entries(cache_file: Path) -> Dict[str, Dict]:
+    """
+    Read cache entries from file.
+    
+    Preconditions: cache_file is Path
+    Postconditions: returns entries, or empty dict if missing/corrupt/old version
+    """
+    if not cache_file.exists():
+        return {}
+    
+    try:
+        data = read_json_file(cache_file)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(data, dict) or data.get('version') != PARSE_CACHE_VERSION:
+        return {}
+    
+    entries = data.get('files', {})
+    assert isinstance(entries, dict), "Entries must be dict"
+    return entries
+
+
+def get_cached_functions(
+    cache: ParseCache,
+    file_path: str,
+    stat_result: os.stat_result
+) -> Optional[List[FunctionInfo]]:
+    """
+    Look up parse result for unchanged file.
+    
+    Preconditions: stat_result belongs to file_path
+    Postconditions: returns cached FunctionInfo list or None on miss;
+                    a touched-but-identical file refreshes its stat and hits
+    """
+    entry = cache.entries.get(file_path)
+    if entry is None:
+        return None
+    
+    stat_matches = (
+        entry['mtime_ns'] == stat_result.st_mtime_ns and
+        entry['size'] == stat_result.st_size
+    )
+    if not stat_matches:
+        if entry['size'] != stat_result.st_size:
+            return None
+        if compute_file_hash(file_path) != entry['content_hash']:
+            return None
+        entry['mtime_ns'] = stat_result.st_mtime_ns
+        cache.dirty = True
+    
+    functions = [dict_to_function_info(data, file_path) for data in entry['functions']]
+    
+    assert isinstance(functions, list), "Result must be list"
+    return functions
+
+
+def store_functions(
+    cache: ParseCache,
+    file_path: str,
+    stat_result: os.stat_result,
+    functions: List[FunctionInfo],
+    content_hash: str
+) -> None:
+    """
+    Record parse result for file.
+    
+    Preconditions: stat_result taken before the parse; functions and content_hash
+                   both come from the same read of file_path
+    Postconditions: cache entry replaced, cache marked dirty
+    """
+    assert isinstance(functions, list), "Functions must be list"
+    assert len(content_hash) == 64, "SHA-256 hash must be 64 chars"
+    
+    cache.entries[file_path] = {
+        'mtime_ns': stat_result.st_mtime_ns,
+        'size': stat_result.st_size,
+        'content_hash': content_hash,
+        'functions': [function_info_to_dict(func) for func in functions]
+    }
+    cache.dirty = True
+    
+    assert file_path in cache.entries, "Entry must be stored"
+
+
+def compute_file_hash(file_path: str) -> str:
+    """
+    Compute SHA-256 of raw file bytes.
+    
+    Preconditions: file_path points to readable file
+    Postconditions: returns 64-character hex string
+    """
+    result = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+    
+    assert len(result) == 64, "SHA-256 hash must be 64 chars"
+    return result
+
+
+def prune_cache(cache: ParseCache, live_paths: List[str]) -> None:
+    """
+    Drop entries for files no longer present.
+    
+    Preconditions: live_paths lists every file seen in this run
+    Postconditions: cache only holds entries for live_paths
+    """
+    assert cache is not None, "Cache required"
+    
+    live = set(live_paths)
+    stale = [path for path in cache.entries if path not in live]
+    
+    for path in stale:
+        del cache.entries[path]
+    
+    if stale:
+        cache.dirty = True
+    
+    assert all(path in live for path in cache.entries), "Only live entries remain"
+
+
+def save_parse_cache(cache: ParseCache) -> None:
+    """
+    Persist cache entries if modified.
+    
+    Preconditions: cache initialized
+    Postconditions: cache file reflects entries, dirty flag cleared
+    """
+    assert cache is not None, "Cache required"
+    
+    if not cache.dirty:
+        return
+    
+    initialize_storage(cache.storage_path)
+    content = encode_json({'version': PARSE_CACHE_VERSION, 'files': cache.entries})
+    write_file_atomic(cache.cache_file, content)
+    cache.dirty = False
+    
+    assert cache.cache_file.exists(), "Cache file must exist"
+
+
+def function_info_to_dict(func: FunctionInfo) -> Dict:
+    """
+    Convert FunctionInfo to cache record (file path implied by entry key).
+    
+    Preconditions: func is valid FunctionInfo
+    Postconditions: returns serializable dictionary
+    """
+    assert func is not None, "Function info required"
+    
+    data = {
+        'name': func.name,
+        'line_number': func.line_number,
+        'end_line_number': func.end_line_number,
+        'body': func.body,
+        'calls': func.calls,
+        'code_hash': func.code_hash
+    }
+    
+    assert data['name'] == func.name, "Name must match"
+    return data
+
+
+def dict_to_function_info(data: Dict, file_path: str) -> FunctionInfo:
+    """
+    Convert cache record back to FunctionInfo.
+    
+    Preconditions: data produced by function_info_to_dict
+    Postconditions: returns FunctionInfo for file_path
+    """
+    assert 'name' in data, "Name required in data"
+    assert file_path, "File path required"
+    
+    return FunctionInfo(
+        name=data['name'],
+        file_path=file_path,
+        line_number=data['line_number'],
+        end_line_number=data['end_line_number'],
+        body=data['body'],
+        calls=list(data['calls']),
+        code_hash=data['code_hash']
+    )
@@ -6,7 +6,10 @@ from core.call_graph import (
     CallGraphNode,
     build_call_graph,
     find_entry_points,
-    get_abstraction_depth
+    get_abstraction_depth,
+    build_name_index,
+    get_call_path,
+    find_strongly_connected_components
 )
 from core.parser import FunctionInfo
 
@@ -21,7 +24,7 @@ def test_call_graph_initialization():
     graph = CallGraph()
     
     assert len(graph.nodes) == 0
-    assert len(graph.graph) == 0
+    assert find_entry_points(graph) == []
 
 
 def test_add_function_to_graph():
@@ -157,5 +160,121 @@ def test_call_graph_node_creation():
     assert len(node.callees) == 0
 
 
+def test_build_name_index_preserves_order():
+    """
+    Test name index groups keys by function name.
+    
+    Preconditions: same function name defined in two files
+    Postconditions: keys listed in graph insertion order
+    """
+    func1 = FunctionInfo(
+        name="helper",
+        file_path="a.py",
+        line_number=1,
+        end_line_number=2,
+        body="def helper(): pass",
+        calls=[],
+        code_hash="abc1"
+    )
+    func2 = FunctionInfo(
+        name="helper",
+        file_path="b.py",
+        line_number=1,
+        end_line_number=2,
+        body="def helper(): pass",
+        calls=[],
+        code_hash="abc2"
+    )
+    func3 = FunctionInfo(
+        name="main",
+        file_path="b.py",
+        line_number=4,
+        end_line_number=5,
+        body="def main(): helper()",
+        calls=["helper"],
+        code_hash="abc3"
+    )
+    
+    graph = build_call_graph([func1, func2, func3])
+    name_index = build_name_index(graph)
+    
+    assert name_index["helper"] == ["a.py::helper", "b.py::helper"]
+    assert graph.nodes["b.py::main"].callees == {"a.py::helper"}
+    assert graph.nodes["a.py::helper"].callers == {"b.py::main"}
+
+
+def test_abstraction_depth_multiple_levels():
+    """
+    Test abstraction depth across a call chain.
+    
+    Preconditions: graph with main -> process -> calculate
+    Postconditions: depth equals distance from entry point
+    """
+    functions = [
+        FunctionInfo(
+            name=name,
+            file_path="test.py",
+            line_number=idx + 1,
+            end_line_number=idx + 1,
+            body="",
+            calls=calls,
+            code_hash=name
+        )
+        for idx, (name, calls) in enumerate([
+            ("main", ["process"]),
+            ("process", ["calculate"]),
+            ("calculate", [])
+        ])
+    ]
+    
+    graph = build_call_graph(functions)
+    
+    assert get_abstraction_depth(graph, "test.py::main") == 0
+    assert get_abstraction_depth(graph, "test.py::process") == 1
+    assert get_abstraction_depth(graph, "test.py::calculate") == 2
+    assert get_call_path(graph, "test.py::main", "test.py::calculate") == [
+        "test.py::main", "test.py::process", "test.py::calculate"
+    ]
+    assert get_call_path(graph, "test.py::calculate", "test.py::main") is None
+
+
+def test_find_strongly_connected_components():
+    """
+    Test components are grouped and ordered callees first.
+    
+    Preconditions: graph main -> {a <-> b} -> c
+    Postconditions: three components, c before the cycle before main
+    """
+    graph = CallGraph()
+    for name in ("main", "a", "b", "c"):
+        graph.nodes[name] = CallGraphNode(function_name=name, file_path="f.py", line_number=1)
+    graph.nodes["main"].callees.add("a")
+    graph.nodes["a"].callees.add("b")
+    graph.nodes["b"].callees.update({"a", "c"})
+    
+    components = find_strongly_connected_components(graph, "main")
+    
+    assert [sorted(c) for c in components] == [["c"], ["a", "b"], ["main"]]
+
+
+def test_abstraction_depth_sees_direct_edge_changes():
+    """
+    Test depth reflects callee sets edited without graph helpers.
+    
+    Preconditions: depth queried, then an edge added on the nodes directly
+    Postconditions: next query reports the new depth
+    """
+    graph = CallGraph()
+    for name in ("main", "helper"):
+        graph.nodes[name] = CallGraphNode(function_name=name, file_path="f.py", line_number=1)
+    
+    assert get_abstraction_depth(graph, "helper") == 0
+    
+    graph.nodes["main"].callees.add("helper")
+    graph.nodes["helper"].callers.add("main")
+    
+    assert get_abstraction_depth(graph, "helper") == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,304 @@
+"""Tests for storage database module."""
+
+import json
+import threading
+
+import pytest
+
+import storage.database as database
+from core.call_graph import build_call_graph
+from core.contract import AbstractionLevel, create_contract
+from core.parser import FunctionInfo
+from storage.database import (
+    ContractDatabase,
+    save_call_graph,
+    load_call_graph,
+    load_shared_call_graph,
+    shared_call_graph_signature,
+    encode_json,
+    decode_json,
+    read_json_file,
+    save_contract,
+    get_contract,
+    delete_contract,
+    load_all_contracts,
+    get_contract_view,
+    contract_exists
+)
+
+
+def test_load_all_contracts_reuses_cache(tmp_path):
+    """
+    Test unchanged contracts file is served from memory.
+    
+    Preconditions: contract saved through database
+    Postconditions: repeated loads return the same cached dict
+    """
+    db = ContractDatabase(str(tmp_path))
+    save_contract(db, create_contract("func", "test.py", 1))
+    
+    first = load_all_contracts(db)
+    second = load_all_contracts(db)
+    
+    assert first is second
+    assert "test.py::func" in first
+
+
+def test_get_contract_returns_independent_copy(tmp_path):
+    """
+    Test editing a loaded or saved contract leaves the cached record alone.
+    
+    Preconditions: contract saved, then edited without saving
+    Postconditions: next get_contract returns the stored values
+    """
+    db = ContractDatabase(str(tmp_path))
+    saved = create_contract("func", "test.py", 1)
+    save_contract(db, saved)
+    saved.preconditions.append("unsaved")
+    
+    loaded = get_contract(db, "func", "test.py")
+    loaded.metadata['y'] = 2
+    loaded.postconditions.append("oops")
+    
+    reloaded = get_contract(db, "func", "test.py")
+    assert reloaded.preconditions == []
+    assert reloaded.postconditions == []
+    assert reloaded.metadata == {}
+
+
+def test_load_all_contracts_sees_external_write(tmp_path):
+    """
+    Test cache is invalidated when another writer changes the file.
+    
+    Preconditions: contracts file rewritten outside this database instance
+    Postconditions: load returns the new contents
+    """
+    db = ContractDatabase(str(tmp_path))
+    save_contract(db, create_contract("func", "test.py", 1))
+    load_all_contracts(db)
+    
+    other = ContractDatabase(str(tmp_path))
+    save_contract(other, create_contract("other", "test.py", 5))
+    
+    assert get_contract(db, "other", "test.py") is not None
+    assert delete_contract(db, "func", "test.py")
+    assert set(load_all_contracts(ContractDatabase(str(tmp_path)))) == {"test.py::other"}
+
+
+def test_contract_journal_replay(tmp_path):
+    """
+    Test saves and deletes are journaled and replayed by a new instance.
+    
+    Preconditions: contracts saved and deleted without compaction
+    Postconditions: snapshot untouched, fresh database sees final state
+    """
+    db = ContractDatabase(str(tmp_path))
+    save_contract(db, create_contract("func", "test.py", 1))
+    save_contract(db, create_contract("func", "test.py", 7))
+    save_contract(db, create_contract("gone", "test.py", 9))
+    delete_contract(db, "gone", "test.py")
+    
+    reloaded = ContractDatabase(str(tmp_path))
+    
+    assert not db.contracts_file.exists()
+    assert len(db.journal_file.read_bytes().splitlines()) == 4
+    assert get_contract(reloaded, "func", "test.py").line_number == 7
+    assert get_contract(reloaded, "gone", "test.py") is None
+
+
+def test_contract_journal_compaction(tmp_path, monkeypatch):
+    """
+    Test journal is folded into snapshot once it exceeds threshold.
+    
+    Preconditions: compaction threshold lowered below one entry
+    Postconditions: snapshot holds contract, journal removed
+    """
+    monkeypatch.setattr(database, "CONTRACT_JOURNAL_COMPACT_BYTES", 1)
+    db = ContractDatabase(str(tmp_path))
+    
+    save_contract(db, create_contract("func", "test.py", 1))
+    
+    assert not db.journal_file.exists()
+    assert set(json.loads(db.contracts_file.read_text())) == {"test.py::func"}
+    assert get_contract(ContractDatabase(str(tmp_path)), "func", "test.py") is not None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_codec_roundtrip(monkeypatch, use_orjson):
+    """
+    Test encode/decode roundtrip with and without orjson.
+    
+    Preconditions: nested data with non-ASCII text
+    Postconditions: decoded value equals original, output is UTF-8 bytes
+    """
+    if use_orjson and not database.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(database, "ORJSON_AVAILABLE", use_orjson)
+    data = {"key": ["héllo", 1, None], "nested": {"flag": True}}
+    
+    compact = encode_json(data)
+    indented = encode_json(data, indent=True)
+    
+    assert isinstance(compact, bytes)
+    assert decode_json(compact) == data
+    assert decode_json(indented) == data
+    assert b"\n  " in indented
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json_file(tmp_path, monkeypatch, use_orjson):
+    """
+    Test reading JSON files through mapping and stdlib paths.
+    
+    Preconditions: one populated and one empty file
+    Postconditions: populated file decoded, empty file yields None
+    """
+    if use_orjson and not database.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(database, "ORJSON_AVAILABLE", use_orjson)
+    populated = tmp_path / "data.json"
+    empty = tmp_path / "empty.json"
+    populated.write_bytes(encode_json({"key": "välue"}))
+    empty.write_bytes(b"")
+    
+    assert read_json_file(populated) == {"key": "välue"}
+    assert read_json_file(empty) is None
+
+
+def test_call_graph_roundtrip(tmp_path):
+    """
+    Test columnar call graph storage restores nodes and both edge directions.
+    
+    Preconditions: graph with shared callee across files
+    Postconditions: loaded graph matches saved graph
+    """
+    functions = [
+        FunctionInfo("main", "a.py", 1, 3, "", ["helper", "shared"], "h1"),
+        FunctionInfo("helper", "a.py", 5, 6, "", ["shared"], "h2"),
+        FunctionInfo("shared", "b.py", 1, 2, "", [], "h3")
+    ]
+    graph = build_call_graph(functions)
+    db = ContractDatabase(str(tmp_path))
+    
+    save_call_graph(db, graph)
+    loaded = load_call_graph(db)
+    
+    assert list(loaded.nodes) == list(graph.nodes)
+    for key, node in graph.nodes.items():
+        restored = loaded.nodes[key]
+        assert (restored.function_name, restored.file_path, restored.line_number) == \
+            (node.function_name, node.file_path, node.line_number)
+        assert restored.callers == node.callers
+        assert restored.callees == node.callees
+
+
+def test_shared_database_concurrent_saves(tmp_path):
+    """
+    Test saves from several threads through one database are all kept.
+    
+    Preconditions: one ContractDatabase shared by writer threads
+    Postconditions: shared and fresh databases both see every contract
+    """
+    db = ContractDatabase(str(tmp_path))
+    
+    def save_batch(thread_id):
+        for index in range(50):
+            save_contract(db, create_contract(f"func{thread_id}_{index}", "test.py", index + 1))
+            load_all_contracts(db)
+    
+    threads = [threading.Thread(target=save_batch, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(load_all_contracts(db)) == 200
+    assert len(load_all_contracts(ContractDatabase(str(tmp_path)))) == 200
+
+
+def test_get_contract_view_matches_contract(tmp_path):
+    """
+    Test lazy contract view exposes the same fields as the full contract.
+    
+    Preconditions: contract with conditions and predictions saved
+    Postconditions: view fields equal contract fields, missing key yields None
+    """
+    db = ContractDatabase(str(tmp_path))
+    contract = create_contract("func", "test.py", 3, ["x > 0"], ["returns x"])
+    contract.input_prediction = "positive int"
+    contract.abstraction_level = AbstractionLevel.HIGH
+    save_contract(db, contract)
+    
+    view = get_contract_view(db, "func", "test.py")
+    full = get_contract(db, "func", "test.py")
+    
+    for field in ("name", "file_path", "line_number", "preconditions", "postconditions",
+                  "input_prediction", "output_prediction", "abstraction_level", "metadata"):
+        assert getattr(view, field) == getattr(full, field)
+    assert get_contract_view(db, "missing", "test.py") is None
+
+
+def test_contract_exists(tmp_path):
+    """
+    Test existence check tracks saves and deletes.
+    
+    Preconditions: empty database
+    Postconditions: contract_exists reflects current contents
+    """
+    db = ContractDatabase(str(tmp_path))
+    assert not contract_exists(db, "func", "test.py")
+    
+    save_contract(db, create_contract("func", "test.py", 1))
+    assert contract_exists(db, "func", "test.py")
+    assert not contract_exists(db, "func", "other.py")
+    
+    delete_contract(db, "func", "test.py")
+    assert not contract_exists(db, "func", "test.py")
+
+
+def test_load_shared_call_graph_reloads_on_change(tmp_path):
+    """
+    Test shared graph is reused until the graph file is rewritten.
+    
+    Preconditions: graph saved, then saved again with another function
+    Postconditions: same object while unchanged, fresh graph after save
+    """
+    db = ContractDatabase(str(tmp_path))
+    assert load_shared_call_graph(db) is None
+    
+    save_call_graph(db, build_call_graph([FunctionInfo("main", "a.py", 1, 2, "", [], "h1")]))
+    first = load_shared_call_graph(db)
+    assert load_shared_call_graph(db) is first
+    
+    save_call_graph(db, build_call_graph([
+        FunctionInfo("main", "a.py", 1, 2, "", ["helper"], "h1"),
+        FunctionInfo("helper", "a.py", 4, 5, "", [], "h2")
+    ]))
+    second = load_shared_call_graph(db)
+    assert second is not first
+    assert len(second.nodes) == 2
+
+
+def test_shared_call_graph_signature_tracks_loads(tmp_path):
+    """
+    Test graph signature changes only when a new graph version is loaded.
+    
+    Preconditions: graph saved, loaded, then saved again with another function
+    Postconditions: signature None before load, stable while reused, new after reload
+    """
+    db = ContractDatabase(str(tmp_path))
+    assert shared_call_graph_signature(db) is None
+    
+    save_call_graph(db, build_call_graph([FunctionInfo("main", "a.py", 1, 2, "", [], "h1")]))
+    load_shared_call_graph(db)
+    first = shared_call_graph_signature(db)
+    load_shared_call_graph(db)
+    assert first is not None
+    assert shared_call_graph_signature(db) == first
+    
+    save_call_graph(db, build_call_graph([
+        FunctionInfo("main", "a.py", 1, 2, "", ["helper"], "h1"),
+        FunctionInfo("helper", "a.py", 4, 5, "", [], "h2")
+    ]))
+    load_shared_call_graph(db)
+    assert shared_call_graph_signature(db) != first
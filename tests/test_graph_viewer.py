@@ -0,0 +1,203 @@
+"""Tests for call graph visualization."""
+
+import io
+import subprocess
+
+from core.call_graph import CallGraph, CallGraphNode
+from visualization.graph_viewer import (
+    render_text_tree,
+    write_text_tree,
+    find_longest_path,
+    build_dot_source,
+    generate_dot_graph,
+    print_graph_statistics
+)
+
+
+def make_graph(edges):
+    """
+    Build call graph from caller/callee name pairs in file f.py.
+    
+    Preconditions: edges is list of (caller, callee) names
+    Postconditions: returns graph with one node per name
+    """
+    graph = CallGraph()
+    for name in sorted({name for edge in edges for name in edge}):
+        graph.nodes[f"f.py::{name}"] = CallGraphNode(
+            function_name=name,
+            file_path="f.py",
+            line_number=1
+        )
+    for caller, callee in edges:
+        graph.nodes[f"f.py::{caller}"].callees.add(f"f.py::{callee}")
+    return graph
+
+
+def test_render_text_tree_order_and_depth():
+    """
+    Test tree lists callees sorted, depth-first, within max_depth.
+    
+    Preconditions: graph with two levels below root
+    Postconditions: lines indented by depth, deeper levels cut off
+    """
+    graph = make_graph([("main", "b"), ("main", "a"), ("a", "c"), ("c", "d")])
+    
+    assert render_text_tree(graph, "f.py::main", max_depth=3) == (
+        "- main\n  - a\n    - c\n  - b"
+    )
+
+
+def test_render_text_tree_unbounded_depth():
+    """
+    Test huge max_depth costs nothing beyond the depth actually reached.
+    
+    Preconditions: short chain, max_depth far beyond it
+    Postconditions: renders the full chain
+    """
+    graph = make_graph([("main", "a"), ("a", "b")])
+    
+    assert render_text_tree(graph, "f.py::main", max_depth=10**9) == (
+        "- main\n  - a\n    - b"
+    )
+
+
+def test_render_text_tree_visits_once():
+    """
+    Test shared callees and cycles are printed only at first visit.
+    
+    Preconditions: graph with shared callee and back edge
+    Postconditions: each function appears once
+    """
+    graph = make_graph([("main", "a"), ("main", "b"), ("a", "b"), ("b", "main")])
+    
+    assert render_text_tree(graph, "f.py::main") == "- main\n  - a\n    - b"
+
+
+def test_write_text_tree_matches_render():
+    """
+    Test streamed tree equals rendered tree plus trailing newlines.
+    
+    Preconditions: graph with branches
+    Postconditions: stream output matches render_text_tree
+    """
+    graph = make_graph([("main", "a"), ("main", "b"), ("b", "c")])
+    stream = io.StringIO()
+    
+    write_text_tree(stream, graph, "f.py::main")
+    
+    assert stream.getvalue() == render_text_tree(graph, "f.py::main") + "\n"
+
+
+def test_find_longest_path_through_cycle():
+    """
+    Test longest path walks through a cycle once before leaving it.
+    
+    Preconditions: graph with a two-node cycle feeding a chain
+    Postconditions: returns longest simple path from start
+    """
+    graph = make_graph([
+        ("main", "a"), ("a", "b"), ("b", "a"), ("b", "c"),
+        ("c", "d"), ("main", "d")
+    ])
+    
+    path = find_longest_path(graph, "f.py::main")
+    
+    assert path == ["f.py::main", "f.py::a", "f.py::b", "f.py::c", "f.py::d"]
+
+
+def test_find_longest_path_wide_dag():
+    """
+    Test layered DAG is solved without enumerating every path.
+    
+    Preconditions: 200-node chain where each node also skips ahead
+    Postconditions: path visits every node in order
+    """
+    names = [f"n{i:03d}" for i in range(200)]
+    edges = [(names[i], names[j]) for i in range(200) for j in range(i + 1, min(i + 4, 200))]
+    graph = make_graph(edges)
+    
+    path = find_longest_path(graph, "f.py::n000")
+    
+    assert path == [f"f.py::{name}" for name in names]
+
+
+def test_build_dot_source():
+    """
+    Test DOT source uses integer IDs with escaped name labels.
+    
+    Preconditions: graph with a quote in a key and an edge leaving the graph
+    Postconditions: nodes numbered in graph order, external callee labeled by key
+    """
+    graph = make_graph([("main", 'say"hi')])
+    graph.nodes["f.py::main"].callees.add("lib.py::external")
+    
+    source = build_dot_source(graph)
+    
+    assert source == (
+        "// Call Graph\ndigraph {\n"
+        '\t0 [label="main"]\n'
+        "\t0 -> 1\n"
+        '\t2 [label="lib.py::external"]\n'
+        "\t0 -> 2\n"
+        '\t1 [label="say\\"hi"]\n'
+        "}\n"
+    )
+
+
+def test_generate_dot_graph_without_dot_binary(tmp_path, monkeypatch):
+    """
+    Test missing Graphviz binary keeps DOT source and reports failure.
+    
+    Preconditions: dot not found on PATH
+    Postconditions: returns False, DOT file written
+    """
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    graph = make_graph([("main", "a")])
+    output = tmp_path / "graph"
+    
+    assert generate_dot_graph(graph, str(output)) is False
+    assert output.read_text() == build_dot_source(graph)
+
+
+def test_generate_dot_graph_skips_unchanged_render(tmp_path, monkeypatch):
+    """
+    Test matching hash sidecar short-circuits rendering.
+    
+    Preconditions: PNG and hash from a previous render exist
+    Postconditions: returns True without invoking dot; changed graph re-renders
+    """
+    calls = []
+    
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0)
+    
+    monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/dot")
+    monkeypatch.setattr("subprocess.run", fake_run)
+    graph = make_graph([("main", "a")])
+    output = tmp_path / "graph"
+    
+    assert generate_dot_graph(graph, str(output)) is True
+    (tmp_path / "graph.png").write_bytes(b"png")
+    assert generate_dot_graph(graph, str(output)) is True
+    assert len(calls) == 1
+    
+    graph.nodes["f.py::a"].callees.add("f.py::main")
+    assert generate_dot_graph(graph, str(output)) is True
+    assert len(calls) == 2
+
+
+def test_print_graph_statistics(capsys):
+    """
+    Test statistics are printed as three lines.
+    
+    Preconditions: graph with three nodes and two edges
+    Postconditions: counts and average written to stdout
+    """
+    graph = make_graph([("main", "a"), ("main", "b")])
+    
+    print_graph_statistics(graph)
+    
+    assert capsys.readouterr().out == (
+        "Total functions: 3\nTotal calls: 2\nAverage calls per function: 0.67\n"
+    )
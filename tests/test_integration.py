@@ -3,9 +3,11 @@
 import pytest
 from pathlib import Path
 import tempfile
+import os
 import shutil
 
-from core.parser import parse_file, FunctionInfo
+import cli.commands as commands
+from core.parser import parse_file, FunctionInfo, TREE_SITTER_AVAILABLE
 from core.call_graph import build_call_graph, find_entry_points
 from core.change_detector import (
     ChangeDetector,
@@ -18,6 +20,7 @@ from storage.database import (
     save_contract,
     get_contract
 )
+from storage.parse_cache import ParseCache
 
 
 def test_end_to_end_python_parsing():
@@ -205,5 +208,62 @@ def test_contract_invalidation_on_change():
         assert "my_func" in report.affected_contracts
 
 
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_parse_cache_ignores_edit_during_parse(tmp_path, monkeypatch):
+    """
+    Test a file saved while indexing is reparsed on the next run.
+    
+    Preconditions: same-size edit lands after the parse, before results are cached
+    Postconditions: next cached parse returns the edited function
+    """
+    source = tmp_path / "module.py"
+    source.write_text("def old():\n    pass\n")
+    original = commands.parse_files_with_hash
+    
+    def parse_then_edit(paths, **kwargs):
+        parsed = original(paths, **kwargs)
+        source.write_text("def new():\n    pass\n")
+        os.utime(source, ns=(1, 1))
+        return parsed
+    
+    monkeypatch.setattr(commands, 'parse_files_with_hash', parse_then_edit)
+    first = commands.parse_files_cached([str(source)], ParseCache(str(tmp_path / "store")))
+    monkeypatch.setattr(commands, 'parse_files_with_hash', original)
+    second = commands.parse_files_cached([str(source)], ParseCache(str(tmp_path / "store")))
+    
+    assert [f.name for f in first[str(source)]] == ["old"]
+    assert [f.name for f in second[str(source)]] == ["new"]
+
+
+def test_iter_source_files_skips_unreadable_and_linked_directories(tmp_path, monkeypatch):
+    """
+    Test walk survives unreadable directories and keeps symlinked files.
+    
+    Preconditions: tree with a locked directory, a file symlink and a directory symlink
+    Postconditions: readable and symlinked files yielded, linked directory not followed
+    """
+    root = tmp_path / "root"
+    outside = tmp_path / "outside"
+    (root / "ok").mkdir(parents=True)
+    (root / "locked").mkdir()
+    outside.mkdir()
+    (root / "ok" / "a.py").write_text("def a():\n    pass\n")
+    (root / "locked" / "b.py").write_text("def b():\n    pass\n")
+    (outside / "c.py").write_text("def c():\n    pass\n")
+    (root / "link.py").symlink_to(outside / "c.py")
+    (root / "linkdir").symlink_to(outside)
+    scandir = os.scandir
+    
+    def guarded_scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(path)
+        return scandir(path)
+    
+    monkeypatch.setattr(os, 'scandir', guarded_scandir)
+    found = sorted(commands.iter_source_files(root))
+    
+    assert found == [str(root / "link.py"), str(root / "ok" / "a.py")]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
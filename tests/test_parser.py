@@ -1,11 +1,19 @@
 """Tests for parser module."""
 
+import sys
+from multiprocessing import get_context
+
 import pytest
 from pathlib import Path
 from core.parser import (
     compute_code_hash,
     get_language_for_file,
-    FunctionInfo
+    extract_functions,
+    parse_file,
+    parse_files,
+    PARALLEL_PARSE_MIN_FILES,
+    FunctionInfo,
+    TREE_SITTER_AVAILABLE
 )
 
 
@@ -54,6 +62,18 @@ def test_compute_code_hash_different():
     assert hash1 != hash2
 
 
+def test_compute_code_hash_bytes_matches_str():
+    """
+    Test hashing raw bytes matches hashing the decoded string.
+    
+    Preconditions: non-ASCII code as str and as UTF-8 bytes
+    Postconditions: both produce the same hash
+    """
+    code = "def greet(): return 'héllo'"
+    
+    assert compute_code_hash(code.encode('utf-8')) == compute_code_hash(code)
+
+
 def test_get_language_python():
     """
     Test language detection for Python.
@@ -145,5 +165,123 @@ def test_function_info_creation():
     assert len(func_info.calls) == 1
 
 
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_extract_functions_incremental_reparse():
+    """
+    Test reparsing edited source matches a fresh parse.
+    
+    Preconditions: same file parsed before and after an edit
+    Postconditions: incremental result equals result for fresh path
+    """
+    original = "def main():\n    helper()\n\ndef helper():\n    pass\n"
+    edited = "def main():\n    helper()\n    other()\n\ndef helper():\n    pass\n\ndef other():\n    pass\n"
+    
+    extract_functions(original, "incremental.py", "python")
+    incremental = extract_functions(edited, "incremental.py", "python")
+    fresh = extract_functions(edited, "fresh.py", "python")
+    
+    assert [(f.name, f.line_number, f.calls, f.code_hash) for f in incremental] == \
+        [(f.name, f.line_number, f.calls, f.code_hash) for f in fresh]
+    assert [f.name for f in incremental] == ["main", "helper", "other"]
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_extract_functions_deeply_nested_calls():
+    """
+    Test traversal handles nesting deeper than the recursion limit.
+    
+    Preconditions: expression nested beyond sys.getrecursionlimit()
+    Postconditions: every nested call collected without RecursionError
+    """
+    depth = sys.getrecursionlimit() + 100
+    code = "def outer():\n    return " + "inner(" * depth + "1" + ")" * depth + "\n"
+    
+    functions = extract_functions(code, "deep.py", "python")
+    
+    assert len(functions) == 1
+    assert functions[0].calls == ["inner"] * depth
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_extract_functions_nested_calls():
+    """
+    Test calls inside nested functions are attributed to every enclosing function.
+    
+    Preconditions: function defined inside another function
+    Postconditions: inner calls listed for inner and outer, outer-only calls for outer
+    """
+    code = "def outer():\n    def inner():\n        leaf()\n    inner()\n    after()\n"
+    
+    functions = {f.name: f for f in extract_functions(code, "nested.py", "python")}
+    
+    assert functions["outer"].calls == ["leaf", "inner", "after"]
+    assert functions["inner"].calls == ["leaf"]
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_parse_file_crlf_matches_lf(tmp_path):
+    """
+    Test CRLF files hash the same as their LF equivalent.
+    
+    Preconditions: identical source saved with CRLF and LF endings
+    Postconditions: bodies and hashes match
+    """
+    source = "def main():\n    helper()\n"
+    lf_file = tmp_path / "lf.py"
+    crlf_file = tmp_path / "crlf.py"
+    lf_file.write_bytes(source.encode('utf-8'))
+    crlf_file.write_bytes(source.replace("\n", "\r\n").encode('utf-8'))
+    
+    lf_functions = parse_file(str(lf_file))
+    crlf_functions = parse_file(str(crlf_file))
+    
+    assert [(f.body, f.code_hash) for f in crlf_functions] == \
+        [(f.body, f.code_hash) for f in lf_functions]
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_parse_file_duplicate_content(tmp_path):
+    """
+    Test identical files yield independent results with their own paths.
+    
+    Preconditions: two files with identical content
+    Postconditions: same functions, each attributed to its own file
+    """
+    source = "def main():\n    helper()\n"
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text(source)
+    second.write_text(source)
+    
+    first_functions = parse_file(str(first))
+    first_functions[0].calls.append("mutated")
+    second_functions = parse_file(str(second))
+    
+    assert [f.file_path for f in second_functions] == [str(second)]
+    assert second_functions[0].calls == ["helper"]
+    assert second_functions[0].code_hash == first_functions[0].code_hash
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+def test_parse_files_spawn_context(tmp_path):
+    """
+    Test pooled parsing with spawned workers matches serial parsing.
+    
+    Preconditions: enough files to use the process pool
+    Postconditions: results per path equal parse_file, in input order
+    """
+    paths = []
+    for index in range(PARALLEL_PARSE_MIN_FILES):
+        path = tmp_path / f"module{index}.py"
+        path.write_text(f"def func{index}():\n    helper{index}()\n")
+        paths.append(str(path))
+    
+    results = parse_files(paths, workers=2, mp_context=get_context('spawn'))
+    
+    assert list(results) == paths
+    assert [[f.name for f in results[path]] for path in paths] == \
+        [[f.name for f in parse_file(path)] for path in paths]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
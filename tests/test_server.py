@@ -0,0 +1,56 @@
+"""Tests for web server helpers."""
+
+import pytest
+
+from core.call_graph import CallGraph, CallGraphNode
+from web.server import extract_function_code
+
+
+def make_unparsed_node(tmp_path, content):
+    """
+    Build graph node for a function the parser cannot find in its file.
+    
+    Preconditions: content is file text
+    Postconditions: returns (node, graph) so code view takes the whole-file fallback
+    """
+    source = tmp_path / "notes.txt"
+    source.write_text(content)
+    graph = CallGraph()
+    node = CallGraphNode(function_name="missing", file_path=str(source), line_number=1)
+    graph.nodes[f"{source}::missing"] = node
+    return node, graph
+
+
+@pytest.mark.parametrize("content", ["first\nsecond\n", "first\nsecond"])
+def test_extract_function_code_exactly_max_lines(tmp_path, content):
+    """
+    Test file with exactly max_lines lines is not reported as truncated.
+    
+    Preconditions: two-line file, with and without final newline, max_lines 2
+    Postconditions: whole file returned without truncated flag
+    """
+    node, graph = make_unparsed_node(tmp_path, content)
+    
+    code_data = extract_function_code(node, graph, max_lines=2)
+    
+    assert code_data['code'] == content
+    assert 'truncated' not in code_data
+
+
+def test_extract_function_code_over_max_lines(tmp_path):
+    """
+    Test file longer than max_lines is cut and flagged.
+    
+    Preconditions: three-line file, max_lines 2
+    Postconditions: first two lines returned with truncated flag
+    """
+    node, graph = make_unparsed_node(tmp_path, "first\nsecond\nthird\n")
+    
+    code_data = extract_function_code(node, graph, max_lines=2)
+    
+    assert code_data['code'] == "first\nsecond"
+    assert code_data['truncated'] is True
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,9 +1,14 @@
 """Call graph visualization."""
 
-from typing import Optional, List, Set
-import networkx as nx
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
 
-from core.call_graph import CallGraph
+from core.call_graph import CallGraph, find_strongly_connected_components
 
 
 def render_text_tree(
@@ -21,48 +26,66 @@ def render_text_tree(
     assert root in graph.nodes, "Root must exist in graph"
     assert max_depth > 0, "Max depth must be positive"
     
-    lines = []
-    visited: Set[str] = set()
-    
-    build_tree_lines(graph, root, 0, max_depth, lines, visited)
-    
-    result = '\n'.join(lines)
+    result = '\n'.join(iter_tree_lines(graph, root, max_depth))
     
     assert isinstance(result, str), "Result must be string"
     return result
 
 
-def build_tree_lines(
+def write_text_tree(
+    stream: TextIO,
     graph: CallGraph,
-    current: str,
-    depth: int,
-    max_depth: int,
-    lines: List[str],
-    visited: Set[str]
+    root: str,
+    max_depth: int = 5
 ) -> None:
     """
-    Recursively build tree lines.
+    Write call graph text tree to stream line by line.
     
-    Preconditions: all parameters valid
-    Postconditions: lines list populated with tree structure
+    Preconditions: graph valid, root exists, max_depth positive
+    Postconditions: tree written to stream, each line newline-terminated
     """
-    if depth >= max_depth or current in visited:
-        return
+    assert graph is not None, "Graph required"
+    assert root in graph.nodes, "Root must exist in graph"
+    assert max_depth > 0, "Max depth must be positive"
     
-    visited.add(current)
-    indent = "  " * depth
-    marker = "- "
+    stream.writelines(line + '\n' for line in iter_tree_lines(graph, root, max_depth))
+
+
+def iter_tree_lines(
+    graph: CallGraph,
+    root: str,
+    max_depth: int
+) -> Iterator[str]:
+    """
+    Walk call tree depth-first with an explicit stack, yielding display lines.
     
-    node = graph.nodes.get(current)
-    if not node:
-        return
+    Preconditions: graph valid, max_depth positive
+    Postconditions: yields one line per first visit within max_depth, callees sorted
+    """
+    assert graph is not None, "Graph required"
+    assert max_depth > 0, "Max depth must be positive"
     
-    display_name = extract_function_name_from_key(current)
-    line = f"{indent}{marker}{display_name}"
-    lines.append(line)
+    nodes = graph.nodes
+    indents = [""]
+    visited: Set[str] = set()
+    stack = [(root, 0)]
     
-    for callee_key in sorted(node.callees):
-        build_tree_lines(graph, callee_key, depth + 1, max_depth, lines, visited)
+    while stack:
+        current, depth = stack.pop()
+        if current in visited:
+            continue
+        
+        visited.add(current)
+        node = nodes.get(current)
+        if not node:
+            continue
+        
+        if depth == len(indents):
+            indents.append(indents[-1] + "  ")
+        yield f"{indents[depth]}- {extract_function_name_from_key(current)}"
+        
+        if depth + 1 < max_depth:
+            stack.extend((callee, depth + 1) for callee in sorted(node.callees, reverse=True))
 
 
 def extract_function_name_from_key(key: str) -> str:
@@ -70,43 +93,107 @@ def extract_function_name_from_key(key: str) -> str:
     Extract function name from function key.
     
     Preconditions: key has format 'path::name'
-    Postconditions: returns function name portion
+    Postconditions: returns text after the last '::', or key if it has none
     """
-    if "::" in key:
-        return key.split("::")[-1]
-    return key
+    return key.rpartition("::")[2]
 
 
 def generate_dot_graph(graph: CallGraph, output_file: str) -> bool:
     """
-    Generate DOT format graph file.
+    Generate DOT source and render it to PNG with the Graphviz dot binary.
     
     Preconditions: graph valid, output_file is path
-    Postconditions: DOT file written, returns success
+    Postconditions: output_file.png written and source removed, returns success;
+                    render skipped when output_file.hash matches the DOT source;
+                    without dot on PATH the DOT source is kept and False returned
     """
     assert graph is not None, "Graph required"
     assert output_file, "Output file required"
     
-    try:
-        import graphviz
-        dot = graphviz.Digraph(comment='Call Graph')
-        
-        for key in graph.nodes:
-            node = graph.nodes[key]
-            display_name = extract_function_name_from_key(key)
-            dot.node(key, display_name)
-        
-        for source_key in graph.nodes:
-            node = graph.nodes[source_key]
-            for target_key in node.callees:
-                dot.edge(source_key, target_key)
-        
-        dot.render(output_file, format='png', cleanup=True)
-        
+    png_file = Path(f"{output_file}.png")
+    hash_file = Path(f"{output_file}.hash")
+    hasher = hashlib.blake2b(digest_size=16)
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as stream:
+        for chunk in iter_dot_chunks(graph):
+            stream.write(chunk)
+            hasher.update(chunk.encode('utf-8'))
+    digest = hasher.hexdigest()
+    
+    if png_file.exists() and hash_file.exists() and hash_file.read_text() == digest:
+        os.remove(output_file)
         return True
-        
-    except ImportError:
+    
+    dot_binary = shutil.which('dot')
+    if dot_binary is None:
+        return False
+    
+    result = subprocess.run(
+        [dot_binary, '-Tpng', '-o', str(png_file), output_file],
+        capture_output=True
+    )
+    if result.returncode != 0:
         return False
+    
+    os.remove(output_file)
+    hash_file.write_text(digest)
+    return True
+
+
+def build_dot_source(graph: CallGraph) -> str:
+    """
+    Build DOT digraph text for call graph.
+    
+    Preconditions: graph valid
+    Postconditions: returns the text generate_dot_graph writes for graph
+    """
+    assert graph is not None, "Graph required"
+    
+    source = ''.join(iter_dot_chunks(graph))
+    
+    assert source.endswith("}\n"), "Digraph must be closed"
+    return source
+
+
+def iter_dot_chunks(graph: CallGraph) -> Iterator[str]:
+    """
+    Yield DOT digraph text in pieces: header, one chunk per node with its edges, footer.
+    
+    Preconditions: graph valid
+    Postconditions: chunks concatenate to DOT source using integer node IDs in graph
+                    order, labeled by function name; callees outside the graph get
+                    the next free ID labeled by full key; edges sorted per node
+    """
+    assert graph is not None, "Graph required"
+    
+    ids = {key: index for index, key in enumerate(graph.nodes)}
+    yield "// Call Graph\ndigraph {\n"
+    
+    for key, node in graph.nodes.items():
+        node_id = ids[key]
+        statements = [f"\t{node_id} [label={quote_dot_id(extract_function_name_from_key(key))}]\n"]
+        for callee in sorted(node.callees):
+            callee_id = ids.get(callee)
+            if callee_id is None:
+                callee_id = ids[callee] = len(ids)
+                statements.append(f"\t{callee_id} [label={quote_dot_id(callee)}]\n")
+            statements.append(f"\t{node_id} -> {callee_id}\n")
+        yield ''.join(statements)
+    
+    assert len(ids) >= len(graph.nodes), "Every node has an ID"
+    yield "}\n"
+
+
+def quote_dot_id(value: str) -> str:
+    """
+    Quote string as DOT identifier.
+    
+    Preconditions: value is string
+    Postconditions: returns double-quoted ID with quotes and backslashes escaped
+    """
+    assert isinstance(value, str), "Value must be string"
+    
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
 
 def print_graph_statistics(graph: CallGraph) -> None:
@@ -119,64 +206,81 @@ def print_graph_statistics(graph: CallGraph) -> None:
     assert graph is not None, "Graph required"
     
     node_count = len(graph.nodes)
-    edge_count = graph.graph.number_of_edges()
-    
-    print(f"Total functions: {node_count}")
-    print(f"Total calls: {edge_count}")
+    edge_count = sum(len(node.callees) for node in graph.nodes.values())
     
+    lines = [f"Total functions: {node_count}\n", f"Total calls: {edge_count}\n"]
     if node_count > 0:
         avg_calls = edge_count / node_count
-        print(f"Average calls per function: {avg_calls:.2f}")
+        lines.append(f"Average calls per function: {avg_calls:.2f}\n")
+    
+    sys.stdout.write(''.join(lines))
     
     assert node_count >= 0, "Count must be non-negative"
 
 
 def find_longest_path(graph: CallGraph, start: str) -> List[str]:
     """
-    Find longest path from start node.
+    Find longest simple path from start node.
     
     Preconditions: graph valid, start exists
     Postconditions: returns longest path as node list
     """
     assert start in graph.nodes, "Start must exist"
     
-    longest = [start]
-    visited: Set[str] = set()
+    best: Dict[str, Tuple[int, List[str], Optional[str]]] = {}
+    for component in find_strongly_connected_components(graph, start):
+        members = set(component)
+        for key in component:
+            best[key] = longest_from(graph, key, members, best)
     
-    explore_paths(graph, start, [start], visited, longest)
+    longest: List[str] = []
+    current: Optional[str] = start
+    while current is not None:
+        _, segment, current = best[current]
+        longest.extend(segment)
     
     assert len(longest) >= 1, "Path must contain at least start"
     return longest
 
 
-def explore_paths(
+def longest_from(
     graph: CallGraph,
-    current: str,
-    path: List[str],
-    visited: Set[str],
-    longest: List[str]
-) -> None:
+    key: str,
+    members: Set[str],
+    best: Dict[str, Tuple[int, List[str], Optional[str]]]
+) -> Tuple[int, List[str], Optional[str]]:
     """
-    Recursively explore paths to find longest.
+    Find longest path from key: a simple path inside its component, then the best exit.
     
-    Preconditions: all parameters valid
-    Postconditions: longest updated with longest found path
+    Preconditions: members is key's component, best holds every component it calls
+    Postconditions: returns (length, path segment inside component, exit key or None)
     """
-    if len(path) > len(longest):
-        longest.clear()
-        longest.extend(path)
-    
-    visited.add(current)
-    node = graph.nodes.get(current)
+    nodes = graph.nodes
+    result = (0, [], None)
+    path = [key]
+    on_path = {key}
+    work: List[Iterator[str]] = []
     
-    if not node:
-        visited.remove(current)
-        return
-    
-    for callee in node.callees:
-        if callee not in visited:
-            path.append(callee)
-            explore_paths(graph, callee, path, visited, longest)
-            path.pop()
+    while path:
+        if len(work) < len(path):
+            tail = nodes.get(path[-1])
+            callees = tail.callees if tail else ()
+            exit_length, exit_key = 0, None
+            for callee in callees:
+                if callee not in members and best[callee][0] > exit_length:
+                    exit_length, exit_key = best[callee][0], callee
+            if len(path) + exit_length > result[0]:
+                result = (len(path) + exit_length, list(path), exit_key)
+            work.append(iter(callees))
+        
+        for callee in work[-1]:
+            if callee in members and callee not in on_path:
+                path.append(callee)
+                on_path.add(callee)
+                break
+        else:
+            work.pop()
+            on_path.discard(path.pop())
     
-    visited.remove(current)
+    assert result[1][0] == key, "Segment must start at key"
+    return result
@@ -1,38 +1,172 @@
 """Web server for visual abstraction tracking interface."""
 
-from flask import Flask, jsonify, request, send_from_directory, send_from_directory
+from flask import Flask, Response, request, send_from_directory
+from array import array
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+import hashlib
 import json
+import logging
 import os
+import re
+import threading
 import traceback
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
 from urllib.parse import unquote, quote
 
-from storage.database import ContractDatabase, load_call_graph, get_contract, save_contract
+from storage.database import (
+    ContractDatabase,
+    LazyContract,
+    LEVEL_BY_VALUE,
+    load_shared_call_graph,
+    shared_call_graph_signature,
+    get_contract,
+    get_contract_view,
+    load_all_contracts,
+    save_contract,
+    encode_json
+)
 from core.call_graph import CallGraph, CallGraphNode
-from core.contract import FunctionContract, AbstractionLevel, create_contract
-from core.parser import parse_file, get_language_for_file
+from core.contract import FunctionContract, create_contract
+from core.parser import (
+    FunctionInfo,
+    extract_functions_by_content,
+    get_language_for_file,
+    normalize_newlines
+)
 from cli.commands import index_source_directory, initialize_project
 
+ASGI_AVAILABLE = False
+
+try:
+    import uvicorn
+    from asgiref.wsgi import WsgiToAsgi
+    ASGI_AVAILABLE = True
+except ImportError:
+    ASGI_AVAILABLE = False
+
+COMPRESS_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+EDGE_SMOOTH = {'type': 'curvedCW', 'roundness': 0.3}
+
+HASHED_ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+COMPRESS_ALGORITHMS = ['br', 'gzip']
+COMPRESS_MIN_SIZE = 1024
+
+GRAPH_STREAM_BATCH_SIZE = 1000
+
+FILE_COLORS = [
+    '#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6',
+    '#1abc9c', '#e67e22', '#34495e', '#16a085', '#27ae60',
+    '#2980b9', '#8e44ad', '#c0392b', '#d35400', '#7f8c8d'
+]
+
+FUNCTION_NAME_INDEX_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+PARSED_FILE_CACHE: 'OrderedDict[str, Tuple[int, int, Dict[Tuple[str, int], FunctionInfo], array]]' = OrderedDict()
+PARSED_FILE_CACHE_SIZE = 256
+PARSED_FILE_CACHE_LOCK = threading.Lock()
+
+LINE_BREAK_PATTERN = re.compile(rb'\r\n?|\n')
+FILE_COLOR_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+INDEX_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='index')
+INDEX_MP_CONTEXT = get_context('spawn')
+INDEX_JOB_LIMIT = 32
+
 
 def create_app(storage_dir: str) -> Flask:
     """
     Create Flask application.
     
     Preconditions: storage_dir is valid directory path
-    Postconditions: returns configured Flask app
+    Postconditions: returns configured Flask app; responses brotli/gzip
+                    compressed when flask-compress is installed
     """
     assert storage_dir, "Storage directory required"
     
     app = Flask(__name__)
     app.config['STORAGE_DIR'] = storage_dir
+    app.extensions['index_jobs'] = OrderedDict()
+    app.extensions['index_jobs_lock'] = threading.Lock()
     
     register_routes(app)
     
+    if COMPRESS_AVAILABLE:
+        app.config['COMPRESS_ALGORITHM'] = COMPRESS_ALGORITHMS
+        app.config['COMPRESS_ALGORITHM_STREAMING'] = COMPRESS_ALGORITHMS
+        app.config['COMPRESS_MIN_SIZE'] = COMPRESS_MIN_SIZE
+        Compress(app)
+    
     assert app is not None, "App must be created"
     return app
 
 
+def json_response(data: Any) -> Response:
+    """
+    Build JSON response with the storage encoder (orjson when installed).
+    
+    Preconditions: data holds only JSON-compatible values with str keys
+    Postconditions: returns application/json response; status set by caller tuple
+    """
+    response = Response(encode_json(data), mimetype='application/json')
+    
+    assert response.mimetype == 'application/json', "Response must be JSON"
+    return response
+
+
+def serve_app(app: Flask, port: int, use_uvicorn: bool = False) -> None:
+    """
+    Serve app on localhost with Flask's threaded server, or uvicorn when requested.
+    
+    Preconditions: port is 1-65535; use_uvicorn only when ASGI_AVAILABLE
+    Postconditions: blocks until the server stops; under uvicorn, asgiref runs
+                    the WSGI app on one thread, so requests are handled in turn
+    """
+    assert 0 < port < 65536, "Port must be 1-65535"
+    assert ASGI_AVAILABLE or not use_uvicorn, "uvicorn and asgiref required"
+    
+    if use_uvicorn:
+        uvicorn.run(WsgiToAsgi(app), host='127.0.0.1', port=port, loop='auto', http='auto')
+        return
+    
+    app.run(host='127.0.0.1', port=port, debug=False, threaded=True)
+
+
+def get_app_database(app: Flask) -> ContractDatabase:
+    """
+    Get database shared by all requests, so its contract and graph caches persist.
+    
+    Preconditions: app has STORAGE_DIR configured
+    Postconditions: returns ContractDatabase for current STORAGE_DIR
+    """
+    assert app.config.get('STORAGE_DIR'), "Storage directory must be configured"
+    
+    storage_path = Path(app.config['STORAGE_DIR'])
+    db = app.config.get('DATABASE')
+    
+    if db is None or db.storage_path != storage_path:
+        db = ContractDatabase(str(storage_path))
+        app.config['DATABASE'] = db
+    
+    assert db.storage_path == storage_path, "Database must match storage directory"
+    return db
+
+
 def register_routes(app: Flask) -> None:
     """
     Register all API routes.
@@ -43,34 +177,34 @@ def register_routes(app: Flask) -> None:
     assert app is not None, "App required"
     
     @app.route('/')
-    def index() -> str:
-        """Serve React app index page."""
-        frontend_build = Path(__file__).parent.parent / 'frontend' / 'dist' / 'index.html'
+    def index() -> Any:
+        """Serve React app index page; revalidated by ETag on every load."""
+        frontend_dist = Path(__file__).parent.parent / 'frontend' / 'dist'
         
-        if frontend_build.exists():
-            return frontend_build.read_text(encoding='utf-8')
+        if (frontend_dist / 'index.html').exists():
+            return send_from_directory(str(frontend_dist), 'index.html', max_age=0)
         
         static_dir = Path(__file__).parent / 'static'
-        index_file = static_dir / 'index.html'
         
-        if index_file.exists():
-            return index_file.read_text(encoding='utf-8')
+        if (static_dir / 'index.html').exists():
+            return send_from_directory(str(static_dir), 'index.html', max_age=0)
         
         return "Frontend not found. Please build React app or create web/static/index.html", 404
     
     @app.route('/<path:path>')
     def serve_static(path: str) -> Any:
-        """Serve static files from React build."""
+        """Serve static files from React build; content-hashed assets cached long-term."""
         frontend_dist = Path(__file__).parent.parent / 'frontend' / 'dist'
         file_path = frontend_dist / path
         
-        if file_path.exists() and file_path.is_file() and file_path.suffix in ['.js', '.css', '.json', '.svg', '.png', '.jpg', '.ico', '.woff', '.woff2', '.ttf', '.eot']:
-            return send_from_directory(str(frontend_dist), path)
+        if file_path.is_file():
+            max_age = HASHED_ASSET_MAX_AGE if path.startswith('assets/') else 0
+            return send_from_directory(str(frontend_dist), path, max_age=max_age)
         
         if not path.startswith('api/'):
             return index()
         
-        return jsonify({'error': 'Not found'}), 404
+        return json_response({'error': 'Not found'}), 404
     
     @app.route('/api/graph')
     def get_graph() -> Dict[str, Any]:
@@ -78,29 +212,21 @@ def register_routes(app: Flask) -> None:
         Get call graph data.
         
         Preconditions: storage directory initialized
-        Postconditions: returns graph data as JSON
+        Postconditions: streams graph data as JSON, encoded in batches
         """
-        storage_dir = app.config['STORAGE_DIR']
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        assert app.config.get('STORAGE_DIR'), "Storage directory must be configured"
+        
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
         if not graph:
-            return jsonify({
+            return json_response({
                 'nodes': [],
                 'edges': [],
                 'error': 'No graph found. Run index first.'
             })
         
-        nodes_data = serialize_nodes_for_frontend(graph, db)
-        edges_data = serialize_edges_for_frontend(graph)
-        
-        result = {
-            'nodes': nodes_data,
-            'edges': edges_data
-        }
-        
-        assert isinstance(result, dict), "Result must be dict"
-        return jsonify(result)
+        return Response(iter_graph_json_chunks(graph, db), mimetype='application/json')
     
     @app.route('/api/contract/', defaults={'function_key': ''}, methods=['GET'])
     @app.route('/api/contract/<path:function_key>', methods=['GET'])
@@ -125,26 +251,27 @@ def register_routes(app: Flask) -> None:
         function_key = function_key.lstrip('/')
         function_key = '/' + function_key
         
-        print(f"[DEBUG] contract GET - request.path: {repr(request.path)}")
-        print(f"[DEBUG] contract GET - decoded: {repr(function_key)}")
+        logger.debug("contract GET - request.path: %r", request.path)
+        logger.debug("contract GET - decoded: %r", function_key)
         
-        storage_dir = app.config['STORAGE_DIR']
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
-        if graph and function_key not in graph.nodes:
-            normalized_key = normalize_function_key(function_key, graph)
+        key_parts = parse_function_key(function_key)
+        if graph and key_parts and function_key not in graph.nodes:
+            normalized_key = normalize_function_key(key_parts, graph)
             if normalized_key:
                 function_key = normalized_key
+                key_parts = parse_function_key(function_key)
         
-        contract = get_contract_by_key(db, function_key)
+        contract = get_contract_view(db, key_parts[1], key_parts[0]) if key_parts else None
         
         if not contract:
             contract = create_contract_from_key(db, function_key)
             if not contract:
                 available_keys = list(graph.nodes.keys())[:10] if graph else []
                 matching_keys = [k for k in (graph.nodes.keys() if graph else []) if '::' in function_key and function_key.split('::')[-1] in k]
-                return jsonify({
+                return json_response({
                     'error': f'Function not found: {function_key}',
                     'debug': {
                         'requested_key': function_key,
@@ -156,7 +283,7 @@ def register_routes(app: Flask) -> None:
         contract_data = serialize_contract_for_frontend(contract)
         
         assert isinstance(contract_data, dict), "Result must be dict"
-        return jsonify(contract_data)
+        return json_response(contract_data)
     
     @app.route('/api/contract/<path:function_key>', methods=['POST'])
     def update_function_contract(function_key: str) -> Dict[str, Any]:
@@ -172,41 +299,44 @@ def register_routes(app: Flask) -> None:
         if path_from_request:
             function_key = path_from_request
         elif not function_key:
-            return jsonify({'error': 'Function key required'}), 400
+            return json_response({'error': 'Function key required'}), 400
         
         # Decode URL encoding
         function_key = unquote(function_key, encoding='utf-8')
         function_key = function_key.lstrip('/')
         function_key = '/' + function_key
         
-        print(f"[DEBUG] contract POST - request.path: {repr(request.path)}")
-        print(f"[DEBUG] contract POST - decoded: {repr(function_key)}")
+        logger.debug("contract POST - request.path: %r", request.path)
+        logger.debug("contract POST - decoded: %r", function_key)
         
-        storage_dir = app.config['STORAGE_DIR']
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
-        if graph and function_key not in graph.nodes:
-            normalized_key = normalize_function_key(function_key, graph)
+        key_parts = parse_function_key(function_key)
+        if graph and key_parts and function_key not in graph.nodes:
+            normalized_key = normalize_function_key(key_parts, graph)
             if normalized_key:
                 function_key = normalized_key
+                key_parts = parse_function_key(function_key)
         
         data = request.get_json()
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return json_response({'error': 'No data provided'}), 400
+        if not isinstance(data, dict):
+            return json_response({'error': 'Contract data must be a JSON object'}), 400
         
-        contract = get_contract_by_key(db, function_key)
+        contract = get_contract_by_key_parts(db, key_parts) if key_parts else None
         
         if not contract:
             contract = create_contract_from_key(db, function_key)
             if not contract:
-                return jsonify({'error': 'Function not found in graph'}), 404
+                return json_response({'error': 'Function not found in graph'}), 404
         
         update_contract_from_data(contract, data)
         save_contract(db, contract)
         
         contract_data = serialize_contract_for_frontend(contract)
-        return jsonify({
+        return json_response({
             'success': True, 
             'message': 'Contract saved',
             'contract': contract_data
@@ -220,18 +350,17 @@ def register_routes(app: Flask) -> None:
         Preconditions: storage directory initialized
         Postconditions: returns tree structure of functions
         """
-        storage_dir = app.config['STORAGE_DIR']
-        workspace_path = app.config.get('WORKSPACE_PATH', '')
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        workspace_path_obj = app.config.get('WORKSPACE_PATH_RESOLVED')
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
         if not graph:
-            return jsonify({'tree': {}})
+            return json_response({'tree': {}})
         
-        tree = build_directory_tree(graph, db, workspace_path)
+        tree = build_directory_tree(graph, db, workspace_path_obj)
         
         assert isinstance(tree, dict), "Result must be dict"
-        return jsonify({'tree': tree})
+        return json_response({'tree': tree})
     
     @app.route('/api/function-graph/', defaults={'function_key': ''})
     @app.route('/api/function-graph/<path:function_key>')
@@ -249,27 +378,25 @@ def register_routes(app: Flask) -> None:
         function_key = function_key.lstrip('/')
         function_key = '/' + function_key
         
-        print(f"[DEBUG] function-graph - received: {repr(function_key)}")
-        print(f"[DEBUG] function-graph - request.path: {request.path}")
+        logger.debug("function-graph - received: %r", function_key)
+        logger.debug("function-graph - request.path: %s", request.path)
         
-        storage_dir = app.config['STORAGE_DIR']
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
         if not graph:
-            return jsonify({'error': 'Graph not found'}), 404
+            return json_response({'error': 'Graph not found'}), 404
         
-        print(f"[DEBUG] function-graph - key in graph: {function_key in graph.nodes}")
-        if function_key in graph.nodes:
-            print(f"[DEBUG] function-graph - DIRECT MATCH!")
+        logger.debug("function-graph - key in graph: %s", function_key in graph.nodes)
         
+        key_parts = parse_function_key(function_key)
         if function_key not in graph.nodes:
-            normalized_key = normalize_function_key(function_key, graph)
+            normalized_key = normalize_function_key(key_parts, graph) if key_parts else None
             if normalized_key:
                 function_key = normalized_key
             else:
                 matching_keys = [k for k in graph.nodes.keys() if function_key.split('::')[-1] in k] if '::' in function_key else []
-                return jsonify({
+                return json_response({
                     'error': f'Function not found: {function_key}',
                     'debug': {
                         'requested_key': function_key,
@@ -281,7 +408,7 @@ def register_routes(app: Flask) -> None:
         focused_graph = build_focused_graph(graph, function_key, db)
         
         assert isinstance(focused_graph, dict), "Result must be dict"
-        return jsonify(focused_graph)
+        return json_response(focused_graph)
     
     @app.route('/api/function-code/', defaults={'function_key': ''})
     @app.route('/api/function-code/<path:function_key>')
@@ -289,9 +416,14 @@ def register_routes(app: Flask) -> None:
         """
         Get source code for specific function.
         
-        Preconditions: function_key is valid identifier
-        Postconditions: returns function source code with metadata
+        Preconditions: function_key is valid identifier, optional max_lines query positive
+        Postconditions: returns function source code with metadata, at most max_lines lines;
+                        304 when If-None-Match holds the current ETag
         """
+        max_lines = request.args.get('max_lines', type=int)
+        if 'max_lines' in request.args and (max_lines is None or max_lines < 1):
+            return json_response({'error': 'max_lines must be a positive integer'}), 400
+        
         if not function_key:
             function_key = request.path.replace('/api/function-code/', '')
         
@@ -299,22 +431,22 @@ def register_routes(app: Flask) -> None:
         function_key = function_key.lstrip('/')
         function_key = '/' + function_key
         
-        print(f"[DEBUG] function-code - received: {repr(function_key)}")
+        logger.debug("function-code - received: %r", function_key)
         
-        storage_dir = app.config['STORAGE_DIR']
-        db = ContractDatabase(storage_dir)
-        graph = load_call_graph(db)
+        db = get_app_database(app)
+        graph = load_shared_call_graph(db)
         
         if not graph:
-            return jsonify({'error': 'Graph not found'}), 404
+            return json_response({'error': 'Graph not found'}), 404
         
+        key_parts = parse_function_key(function_key)
         if function_key not in graph.nodes:
-            normalized_key = normalize_function_key(function_key, graph)
+            normalized_key = normalize_function_key(key_parts, graph) if key_parts else None
             if normalized_key:
                 function_key = normalized_key
             else:
                 matching_keys = [k for k in graph.nodes.keys() if function_key.split('::')[-1] in k] if '::' in function_key else []
-                return jsonify({
+                return json_response({
                     'error': f'Function not found: {function_key}',
                     'debug': {
                         'requested_key': function_key,
@@ -324,10 +456,20 @@ def register_routes(app: Flask) -> None:
                 }), 404
         
         node = graph.nodes[function_key]
-        code_data = extract_function_code(node, graph)
+        etag = function_code_etag(node, shared_call_graph_signature(db), max_lines)
+        if etag is not None and request.if_none_match.contains_weak(etag):
+            not_modified = Response(status=304)
+            not_modified.set_etag(etag, weak=True)
+            return not_modified
+        
+        code_data = extract_function_code(node, graph, max_lines)
         
         assert isinstance(code_data, dict), "Result must be dict"
-        return jsonify(code_data)
+        response = json_response(code_data)
+        if etag is not None:
+            response.set_etag(etag, weak=True)
+            response.cache_control.no_cache = True
+        return response
     
     @app.route('/api/workspace', methods=['GET', 'POST'])
     def workspace() -> Dict[str, Any]:
@@ -339,47 +481,49 @@ def register_routes(app: Flask) -> None:
         """
         if request.method == 'GET':
             workspace = app.config.get('WORKSPACE_PATH', '')
-            return jsonify({'workspace': workspace})
+            return json_response({'workspace': workspace})
         
         data = request.get_json()
         if not data or 'path' not in data:
-            return jsonify({'error': 'Path required'}), 400
+            return json_response({'error': 'Path required'}), 400
         
         workspace_path = str(data['path']).strip()
         if not workspace_path:
-            return jsonify({'error': 'Path cannot be empty'}), 400
+            return json_response({'error': 'Path cannot be empty'}), 400
         
         path_obj = Path(workspace_path)
         if not path_obj.is_absolute():
             path_obj = Path.cwd() / path_obj
         
         if not path_obj.exists():
-            return jsonify({'error': f'Path does not exist: {path_obj}'}), 400
+            return json_response({'error': f'Path does not exist: {path_obj}'}), 400
         
         if not path_obj.is_dir():
-            return jsonify({'error': 'Path must be a directory'}), 400
+            return json_response({'error': 'Path must be a directory'}), 400
         
-        workspace_path = str(path_obj.resolve())
+        resolved_path = path_obj.resolve()
+        workspace_path = str(resolved_path)
         
         app.config['WORKSPACE_PATH'] = workspace_path
+        app.config['WORKSPACE_PATH_RESOLVED'] = resolved_path
         
-        return jsonify({'success': True, 'workspace': workspace_path})
+        return json_response({'success': True, 'workspace': workspace_path})
     
     @app.route('/api/index', methods=['POST'])
     def index_workspace() -> Dict[str, Any]:
         """
-        Index source directory in workspace.
+        Start indexing source directory in workspace on the background worker.
         
         Preconditions: workspace path is set
-        Postconditions: source directory indexed, returns function count
+        Postconditions: returns 202 with job_id to poll at /api/index/status/<job_id>
         """
         workspace_path = app.config.get('WORKSPACE_PATH')
         storage_dir = app.config.get('STORAGE_DIR')
         
         if not workspace_path:
             error_msg = 'Workspace not set. Please set workspace first.'
-            print(f"[ERROR] {error_msg}")
-            return jsonify({
+            logger.error("%s", error_msg)
+            return json_response({
                 'success': False,
                 'error': error_msg,
                 'debug': {
@@ -391,8 +535,8 @@ def register_routes(app: Flask) -> None:
         workspace_path_obj = Path(workspace_path)
         if not workspace_path_obj.exists():
             error_msg = f'Workspace path does not exist: {workspace_path}'
-            print(f"[ERROR] {error_msg}")
-            return jsonify({
+            logger.error("%s", error_msg)
+            return json_response({
                 'success': False,
                 'error': error_msg,
                 'debug': {
@@ -403,8 +547,8 @@ def register_routes(app: Flask) -> None:
         
         if not workspace_path_obj.is_dir():
             error_msg = f'Workspace path is not a directory: {workspace_path}'
-            print(f"[ERROR] {error_msg}")
-            return jsonify({
+            logger.error("%s", error_msg)
+            return json_response({
                 'success': False,
                 'error': error_msg
             }), 400
@@ -414,60 +558,179 @@ def register_routes(app: Flask) -> None:
             try:
                 project_root = storage_path_obj.parent
                 if not project_root.exists():
-                    return jsonify({
+                    return json_response({
                         'success': False,
                         'error': f'Project root directory does not exist: {project_root}'
                     }), 400
                 
                 if not initialize_project(str(project_root)):
-                    return jsonify({
+                    return json_response({
                         'success': False,
                         'error': f'Failed to initialize storage directory: {storage_dir}'
                     }), 500
             except Exception as e:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': f'Failed to initialize storage: {str(e)}'
                 }), 500
         
-        try:
-            count = index_source_directory(str(workspace_path_obj.resolve()), str(storage_path_obj.resolve()))
-            return jsonify({
-                'success': True,
-                'count': count,
-                'message': f'Indexed {count} functions'
-            })
-        except AssertionError as e:
-            return jsonify({
-                'success': False,
-                'error': f'Validation error: {str(e)}'
-            }), 400
-        except Exception as e:
-            error_trace = traceback.format_exc()
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'traceback': error_trace
-            }), 500
+        job_id = add_index_job(app, INDEX_EXECUTOR.submit(
+            run_index_job,
+            str(workspace_path_obj.resolve()),
+            str(storage_path_obj.resolve())
+        ))
+        
+        return json_response({'success': True, 'job_id': job_id, 'done': False}), 202
+    
+    @app.route('/api/index/status/<job_id>')
+    def index_status(job_id: str) -> Dict[str, Any]:
+        """
+        Report progress of background index job.
+        
+        Preconditions: job_id returned by POST /api/index
+        Postconditions: returns done flag, and the job result once finished
+                        (finished jobs are forgotten after being reported)
+        """
+        assert job_id, "Job id required"
+        
+        jobs = app.extensions['index_jobs']
+        with app.extensions['index_jobs_lock']:
+            job = jobs.get(job_id)
+            if job is not None and job.done():
+                del jobs[job_id]
+        
+        if job is None:
+            return json_response({'success': False, 'error': f'Unknown index job: {job_id}'}), 404
+        
+        if not job.done():
+            return json_response({'success': True, 'job_id': job_id, 'done': False})
+        
+        return json_response({**job.result(), 'job_id': job_id, 'done': True})
+
+
+def add_index_job(app: Flask, job: Future) -> str:
+    """
+    Register background index job on app, forgetting oldest finished jobs over limit.
+    
+    Preconditions: app built by create_app
+    Postconditions: returns new job id; at most INDEX_JOB_LIMIT finished jobs retained
+    """
+    assert 'index_jobs' in app.extensions, "App must be built by create_app"
+    
+    job_id = uuid.uuid4().hex
+    jobs = app.extensions['index_jobs']
+    
+    with app.extensions['index_jobs_lock']:
+        jobs[job_id] = job
+        excess = len(jobs) - INDEX_JOB_LIMIT
+        if excess > 0:
+            finished = [key for key, pending in jobs.items() if pending.done()]
+            for key in finished[:excess]:
+                del jobs[key]
+    
+    assert len(job_id) == 32, "Job id must be hex UUID"
+    return job_id
 
 
-def serialize_nodes_for_frontend(graph: CallGraph, db: ContractDatabase) -> list:
+def run_index_job(source_dir: str, storage_dir: str) -> Dict[str, Any]:
+    """
+    Index source directory, capturing outcome as a response payload.
+    
+    Preconditions: both directories exist
+    Postconditions: returns success with count, or failure with error message;
+                    shared graph reloads on next request since its file changed;
+                    parse workers are spawned, never forked from this threaded server
+    """
+    assert source_dir, "Source directory required"
+    assert storage_dir, "Storage directory required"
+    
+    try:
+        count = index_source_directory(source_dir, storage_dir, INDEX_MP_CONTEXT)
+        return {
+            'success': True,
+            'count': count,
+            'message': f'Indexed {count} functions'
+        }
+    except AssertionError as e:
+        return {
+            'success': False,
+            'error': f'Validation error: {str(e)}'
+        }
+    except Exception as e:
+        logger.exception("Index job failed")
+        return {
+            'success': False,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }
+
+
+def iter_graph_json_chunks(graph: CallGraph, db: ContractDatabase) -> Iterator[bytes]:
+    """
+    Encode graph as {"nodes": [...], "edges": [...]} in batches for a streamed response.
+    
+    Preconditions: graph and db are valid
+    Postconditions: chunks concatenate to one JSON document; at most
+                    GRAPH_STREAM_BATCH_SIZE items are held encoded at a time
+    """
+    assert graph is not None, "Graph required"
+    
+    yield b'{"nodes":['
+    yield from iter_json_array_items(iter_nodes_for_frontend(graph, db))
+    yield b'],"edges":['
+    yield from iter_json_array_items(iter_edges_for_frontend(graph))
+    yield b']}'
+
+
+def iter_json_array_items(items: Iterator[Any]) -> Iterator[bytes]:
+    """
+    Encode items as comma-separated JSON array contents, one batch per chunk.
+    
+    Preconditions: items are JSON-compatible values
+    Postconditions: chunks concatenate to array body without surrounding brackets
+    """
+    assert GRAPH_STREAM_BATCH_SIZE > 0, "Batch size must be positive"
+    
+    separator = b''
+    for batch in iter_batches(items, GRAPH_STREAM_BATCH_SIZE):
+        yield separator + encode_json(batch)[1:-1]
+        separator = b','
+
+
+def iter_batches(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Group items into lists of up to size.
+    
+    Preconditions: size positive
+    Postconditions: yields non-empty lists in item order
+    """
+    assert size > 0, "Batch size must be positive"
+    
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_nodes_for_frontend(graph: CallGraph, db: ContractDatabase) -> Iterator[Dict[str, Any]]:
     """
     Convert graph nodes to frontend format.
     
     Preconditions: graph and db are valid
-    Postconditions: returns list of node dictionaries
+    Postconditions: yields one node dictionary per graph node, in graph order
     """
     assert graph is not None, "Graph required"
     assert db is not None, "Database required"
     
-    nodes = []
     file_colors = get_file_color_map(graph)
+    contracts = load_all_contracts(db)
     
     for key, node in graph.nodes.items():
-        contract = get_contract_by_key(db, key)
+        contract = get_contract_view_by_key(contracts, key)
         
-        node_data = {
+        yield {
             'id': key,
             'label': node.function_name,
             'file': node.file_path,
@@ -477,75 +740,51 @@ def serialize_nodes_for_frontend(graph: CallGraph, db: ContractDatabase) -> list
             'abstractionLevel': get_abstraction_level(contract),
             'fileColor': file_colors.get(node.file_path, '#ecf0f1')
         }
-        
-        nodes.append(node_data)
-    
-    assert isinstance(nodes, list), "Result must be list"
-    return nodes
 
 
 def get_file_color_map(graph: CallGraph) -> Dict[str, str]:
     """
-    Generate color map for files.
+    Generate color map for files, computed once per loaded graph.
     
-    Preconditions: graph is valid
-    Postconditions: returns dict mapping file paths to colors
+    Preconditions: graph is valid and not modified after first call
+    Postconditions: returns dict mapping file paths to colors, shared by callers
     """
     assert graph is not None, "Graph required"
     
-    files = set()
-    for node in graph.nodes.values():
-        files.add(node.file_path)
-    
-    colors = [
-        '#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6',
-        '#1abc9c', '#e67e22', '#34495e', '#16a085', '#27ae60',
-        '#2980b9', '#8e44ad', '#c0392b', '#d35400', '#7f8c8d'
-    ]
+    file_colors = FILE_COLOR_CACHE.get(graph)
+    if file_colors is not None:
+        return file_colors
     
-    file_colors = {}
-    for idx, file_path in enumerate(sorted(files)):
-        file_colors[file_path] = colors[idx % len(colors)]
+    files = {node.file_path for node in graph.nodes.values()}
+    file_colors = {
+        file_path: FILE_COLORS[idx % len(FILE_COLORS)]
+        for idx, file_path in enumerate(sorted(files))
+    }
+    FILE_COLOR_CACHE[graph] = file_colors
     
     assert isinstance(file_colors, dict), "Result must be dict"
     return file_colors
 
 
-def serialize_edges_for_frontend(graph: CallGraph) -> list:
+def iter_edges_for_frontend(graph: CallGraph) -> Iterator[Dict[str, Any]]:
     """
     Convert graph edges to frontend format with direction labels.
     
     Preconditions: graph is valid
-    Postconditions: returns list of edge dictionaries with labels
+    Postconditions: yields one edge dictionary per call, grouped by caller
     """
     assert graph is not None, "Graph required"
     
-    edges = []
-    
     for key, node in graph.nodes.items():
-        caller_name = node.function_name
         for callee_key in node.callees:
-            callee_node = graph.nodes.get(callee_key)
-            callee_name = callee_node.function_name if callee_node else ''
-            
-            edge_data = {
-                'from': key,
-                'to': callee_key,
-                'label': '→',
-                'arrows': 'to',
-                'smooth': {'type': 'curvedCW', 'roundness': 0.3}
-            }
-            edges.append(edge_data)
-    
-    assert isinstance(edges, list), "Result must be list"
-    return edges
+            yield {'from': key, 'to': callee_key, 'label': '→', 'arrows': 'to', 'smooth': EDGE_SMOOTH}
 
 
-def serialize_contract_for_frontend(contract: FunctionContract) -> Dict[str, Any]:
+def serialize_contract_for_frontend(contract: Union[FunctionContract, LazyContract]) -> Dict[str, Any]:
     """
     Convert contract to frontend format.
     
-    Preconditions: contract is valid
+    Preconditions: contract is valid contract or read-only view
     Postconditions: returns serializable dictionary
     """
     assert contract is not None, "Contract required"
@@ -569,44 +808,71 @@ def serialize_contract_for_frontend(contract: FunctionContract) -> Dict[str, Any
     return data
 
 
-def get_contract_by_key(db: ContractDatabase, function_key: str) -> Optional[FunctionContract]:
+def parse_function_key(function_key: str) -> Optional[Tuple[str, str]]:
     """
-    Get contract by function key.
+    Split function key into file path and function name.
     
-    Preconditions: db initialized, key is valid
-    Postconditions: returns contract or None
+    Preconditions: function_key is string
+    Postconditions: returns (file_path, function_name) split at the first '::', or None
     """
-    assert function_key, "Function key required"
+    assert isinstance(function_key, str), "Function key must be string"
     
-    if "::" not in function_key:
+    file_path, separator, function_name = function_key.partition("::")
+    if not separator:
         return None
     
-    file_path, function_name = function_key.split("::", 1)
+    assert "::" not in file_path, "File path ends at the first separator"
+    return file_path, function_name
+
+
+def get_contract_by_key_parts(
+    db: ContractDatabase,
+    key_parts: Tuple[str, str]
+) -> Optional[FunctionContract]:
+    """
+    Get contract by parsed function key.
+    
+    Preconditions: db initialized, key_parts from parse_function_key
+    Postconditions: returns contract or None
+    """
+    assert db is not None, "Database required"
+    assert len(key_parts) == 2, "Key parts must be (file_path, function_name)"
+    
+    file_path, function_name = key_parts
     contract = get_contract(db, function_name, file_path)
     
     return contract
 
 
+def get_contract_view_by_key(contracts: Dict, function_key: str) -> Optional[LazyContract]:
+    """
+    Get read-only contract view by function key from loaded contracts.
+    
+    Preconditions: contracts is result of load_all_contracts, key is valid
+    Postconditions: returns LazyContract or None
+    """
+    assert function_key, "Function key required"
+    
+    data = contracts.get(function_key)
+    if data is None:
+        return None
+    
+    return LazyContract(data)
+
+
 def create_contract_from_key(db: ContractDatabase, function_key: str) -> Optional[FunctionContract]:
     """
     Create contract from function key using graph data.
     
-    Preconditions: db initialized, key exists in graph
-    Postconditions: returns new contract or None
+    Preconditions: db initialized, key already normalized against graph
+    Postconditions: returns new contract, or None if key not in graph
     """
     assert function_key, "Function key required"
     
-    graph = load_call_graph(db)
-    if not graph:
+    graph = load_shared_call_graph(db)
+    if not graph or function_key not in graph.nodes:
         return None
     
-    if function_key not in graph.nodes:
-        function_key_normalized = normalize_function_key(function_key, graph)
-        if function_key_normalized and function_key_normalized in graph.nodes:
-            function_key = function_key_normalized
-        else:
-            return None
-    
     node = graph.nodes[function_key]
     contract = create_contract(
         name=node.function_name,
@@ -618,97 +884,110 @@ def create_contract_from_key(db: ContractDatabase, function_key: str) -> Optiona
     return contract
 
 
-def normalize_function_key(function_key: str, graph: CallGraph) -> Optional[str]:
+def normalize_function_key(key_parts: Tuple[str, str], graph: CallGraph) -> Optional[str]:
     """
-    Try to normalize function key to match graph keys.
+    Try to normalize parsed function key to match graph keys.
     
-    Preconditions: function_key and graph are valid
-    Postconditions: returns normalized key or None if not found
+    Preconditions: key_parts from parse_function_key, graph valid
+    Postconditions: returns graph key with same name and matching file, or None;
+                    paths equal as written win before any path is resolved
     """
-    if "::" not in function_key:
+    assert graph is not None, "Graph required"
+    assert len(key_parts) == 2, "Key parts must be (file_path, function_name)"
+    
+    file_path_str, function_name = key_parts
+    requested = Path(file_path_str)
+    
+    unresolved: List[Tuple[str, Path]] = []
+    for key, key_file_path in get_function_name_index(graph).get(function_name, ()):
+        indexed = Path(key_file_path)
+        if str(requested) == str(indexed):
+            return key
+        if requested.is_absolute() or indexed.is_absolute():
+            unresolved.append((key, indexed))
+    
+    if not unresolved:
         return None
     
-    file_path_str, function_name = function_key.split("::", 1)
+    requested_resolved = resolve_path(requested)
+    if requested_resolved is None:
+        return None
     
-    for key in graph.nodes:
-        if key == function_key:
+    for key, indexed in unresolved:
+        if resolve_path(indexed) == requested_resolved:
             return key
-        
-        if "::" not in key:
-            continue
-        
-        key_file_path, key_function_name = key.split("::", 1)
-        
-        if key_function_name != function_name:
-            continue
-        
-        file_path_obj = Path(file_path_str)
-        key_path_obj = Path(key_file_path)
-        
-        try:
-            if file_path_obj.is_absolute() and key_path_obj.is_absolute():
-                if file_path_obj.resolve() == key_path_obj.resolve():
-                    return key
-            elif str(file_path_obj) == str(key_path_obj):
-                return key
-            elif file_path_obj.is_absolute():
-                try:
-                    if file_path_obj.resolve() == key_path_obj.resolve():
-                        return key
-                except Exception:
-                    pass
-            elif key_path_obj.is_absolute():
-                try:
-                    if key_path_obj.resolve() == file_path_obj.resolve():
-                        return key
-                except Exception:
-                    pass
-        except Exception:
-            continue
     
     return None
 
 
-def build_directory_tree(graph: CallGraph, db: ContractDatabase, workspace_path: str = '') -> Dict[str, Any]:
+def get_function_name_index(graph: CallGraph) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Map function names to (key, file path) pairs, built once per loaded graph.
+    
+    Preconditions: graph is not modified after first lookup
+    Postconditions: returns index in graph order, cached until graph is collected
+    """
+    assert graph is not None, "Graph required"
+    
+    index = FUNCTION_NAME_INDEX_CACHE.get(graph)
+    if index is not None:
+        return index
+    
+    index = {}
+    for key in graph.nodes:
+        if "::" in key:
+            key_file_path, key_function_name = key.split("::", 1)
+            index.setdefault(key_function_name, []).append((key, key_file_path))
+    
+    FUNCTION_NAME_INDEX_CACHE[graph] = index
+    
+    assert sum(map(len, index.values())) <= len(graph.nodes), "At most one entry per node"
+    return index
+
+
+def resolve_path(path: Path) -> Optional[Path]:
+    """
+    Resolve path to absolute form with symlinks followed.
+    
+    Preconditions: path is Path object
+    Postconditions: returns resolved Path, or None if resolution fails
+    """
+    assert isinstance(path, Path), "Path object required"
+    
+    try:
+        return path.resolve()
+    except (OSError, RuntimeError):
+        return None
+
+
+def build_directory_tree(
+    graph: CallGraph,
+    db: ContractDatabase,
+    workspace_path_obj: Optional[Path] = None
+) -> Dict[str, Any]:
     """
     Build nested directory-file-function tree structure.
     
-    Preconditions: graph and db are valid
-    Postconditions: returns nested dictionary structure with relative paths
+    Preconditions: graph and db are valid, workspace_path_obj already resolved or None
+    Postconditions: returns nested dictionary structure with paths relative to workspace
     """
     assert graph is not None, "Graph required"
     assert db is not None, "Database required"
     
     tree: Dict[str, Any] = {}
-    workspace_path_obj = Path(workspace_path).resolve() if workspace_path else None
+    contracts = load_all_contracts(db)
+    
+    file_entries: Dict[str, List[Dict[str, Any]]] = {}
     
     for key, node in graph.nodes.items():
-        contract = get_contract_by_key(db, key)
-        file_path = Path(node.file_path)
+        contract = get_contract_view_by_key(contracts, key)
         
-        if workspace_path_obj and file_path.is_absolute():
-            try:
-                relative_path = file_path.relative_to(workspace_path_obj)
-                file_path_str = str(relative_path)
-            except ValueError:
-                file_path_str = node.file_path
-        else:
-            file_path_str = node.file_path
-        
-        parts = file_path_str.split('/')
-        filename = parts[-1]
-        directory_parts = parts[:-1] if len(parts) > 1 else []
-        
-        current = tree
-        for dir_part in directory_parts:
-            if dir_part not in current:
-                current[dir_part] = {}
-            current = current[dir_part]
+        entries = file_entries.get(node.file_path)
+        if entries is None:
+            file_path_str = relative_tree_path(node.file_path, workspace_path_obj)
+            entries = file_entries[node.file_path] = get_tree_file_entries(tree, file_path_str)
         
-        if filename not in current:
-            current[filename] = []
-        
-        current[filename].append({
+        entries.append({
             'key': key,
             'name': node.function_name,
             'line': node.line_number,
@@ -719,6 +998,49 @@ def build_directory_tree(graph: CallGraph, db: ContractDatabase, workspace_path:
     return tree
 
 
+def relative_tree_path(file_path: str, workspace_path_obj: Optional[Path]) -> str:
+    """
+    Express file path relative to workspace when it lies inside it.
+    
+    Preconditions: workspace_path_obj is resolved or None
+    Postconditions: returns relative path string, or file_path unchanged
+    """
+    assert file_path, "File path required"
+    
+    path = Path(file_path)
+    if not workspace_path_obj or not path.is_absolute():
+        return file_path
+    
+    try:
+        return str(path.relative_to(workspace_path_obj))
+    except ValueError:
+        return file_path
+
+
+def get_tree_file_entries(tree: Dict[str, Any], file_path_str: str) -> List[Dict[str, Any]]:
+    """
+    Walk or create directory nodes for file path and return its function list.
+    
+    Preconditions: tree built by build_directory_tree, file_path_str '/'-separated
+    Postconditions: returns list stored under the file name, created if missing
+    """
+    assert isinstance(tree, dict), "Tree must be dict"
+    
+    parts = file_path_str.split('/')
+    
+    current = tree
+    for dir_part in parts[:-1]:
+        if dir_part not in current:
+            current[dir_part] = {}
+        current = current[dir_part]
+    
+    if parts[-1] not in current:
+        current[parts[-1]] = []
+    
+    assert isinstance(current[parts[-1]], list), "File entry must be function list"
+    return current[parts[-1]]
+
+
 def build_focused_graph(
     graph: CallGraph,
     function_key: str,
@@ -733,34 +1055,20 @@ def build_focused_graph(
     assert function_key in graph.nodes, "Function must exist in graph"
     
     center_node = graph.nodes[function_key]
-    included_keys = {function_key}
-    
-    for callee_key in center_node.callees:
-        included_keys.add(callee_key)
-    
-    for caller_key in center_node.callers:
-        included_keys.add(caller_key)
+    levels = dict.fromkeys(center_node.callees, 2)
+    levels.update(dict.fromkeys(center_node.callers, 0))
+    levels[function_key] = 1
     
     nodes_data = []
     edges_data = []
     file_colors = get_file_color_map(graph)
+    contracts = load_all_contracts(db)
     
-    center_node = graph.nodes[function_key]
-    
-    for key in included_keys:
+    for key, level in levels.items():
         node = graph.nodes[key]
-        contract = get_contract_by_key(db, key)
-        
+        contract = get_contract_view_by_key(contracts, key)
         is_center = (key == function_key)
         
-        level = 0
-        if is_center:
-            level = 1
-        elif key in center_node.callers:
-            level = 0
-        elif key in center_node.callees:
-            level = 2
-        
         node_data = {
             'id': key,
             'label': node.function_name,
@@ -776,10 +1084,10 @@ def build_focused_graph(
         
         nodes_data.append(node_data)
     
-    for key in included_keys:
+    for key in levels:
         node = graph.nodes[key]
         for callee_key in node.callees:
-            if callee_key in included_keys:
+            if callee_key in levels:
                 edges_data.append({
                     'from': key,
                     'to': callee_key,
@@ -797,7 +1105,7 @@ def build_focused_graph(
     return result
 
 
-def has_predictions(contract: Optional[FunctionContract]) -> bool:
+def has_predictions(contract: Optional[Union[FunctionContract, LazyContract]]) -> bool:
     """
     Check if contract has predictions.
     
@@ -815,7 +1123,7 @@ def has_predictions(contract: Optional[FunctionContract]) -> bool:
     return result
 
 
-def get_abstraction_level(contract: Optional[FunctionContract]) -> str:
+def get_abstraction_level(contract: Optional[Union[FunctionContract, LazyContract]]) -> str:
     """
     Get abstraction level string.
     
@@ -828,16 +1136,52 @@ def get_abstraction_level(contract: Optional[FunctionContract]) -> str:
     return contract.abstraction_level.value
 
 
-def extract_function_code(node: CallGraphNode, graph: CallGraph) -> Dict[str, Any]:
+def function_code_etag(
+    node: CallGraphNode,
+    graph_signature: Optional[Tuple[int, int]],
+    max_lines: Optional[int]
+) -> Optional[str]:
+    """
+    Build validator for a code-view response from everything the response depends on.
+    
+    Preconditions: graph_signature identifies the graph version node was taken from
+    Postconditions: returns hex digest over source file version, function identity,
+                    graph version and max_lines; None if source file cannot be stat'ed
+    """
+    assert node is not None, "Node required"
+    
+    try:
+        stat_result = os.stat(node.file_path)
+    except OSError:
+        return None
+    
+    fingerprint = (
+        f"{node.file_path}:{stat_result.st_mtime_ns}:{stat_result.st_size}:"
+        f"{node.function_name}:{node.line_number}:{graph_signature}:{max_lines}"
+    )
+    etag = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16).hexdigest()
+    
+    assert len(etag) == 32, "ETag must be 128-bit hex digest"
+    return etag
+
+
+def extract_function_code(
+    node: CallGraphNode,
+    graph: CallGraph,
+    max_lines: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Extract function source code from file.
     
-    Preconditions: node exists in graph
-    Postconditions: returns code with caller/callee info
+    Preconditions: node exists in graph, max_lines positive or None
+    Postconditions: returns code with caller/callee info; code cut to the first
+                    max_lines lines of the function with 'truncated' set when longer
     """
     assert node is not None, "Node required"
+    assert max_lines is None or max_lines > 0, "Max lines must be positive"
     
     file_path = Path(node.file_path)
+    path_str = str(file_path)
     if not file_path.exists():
         return {
             'code': '',
@@ -848,39 +1192,27 @@ def extract_function_code(node: CallGraphNode, graph: CallGraph) -> Dict[str, An
             'callees': []
         }
     
-    language = get_language_for_file(str(file_path))
+    language = get_language_for_file(path_str)
     if not language:
         language = 'text'
     
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
-        
-        functions = parse_file(str(file_path))
-        target_func = None
-        
-        for func in functions:
-            if func.name == node.function_name and func.line_number == node.line_number:
-                target_func = func
-                break
+        function_index, line_offsets = get_parsed_source(path_str)
+        target_func = function_index.get((node.function_name, node.line_number))
         
         if target_func:
-            start_line = target_func.line_number - 1
-            end_line = target_func.end_line_number
-            code_lines = lines[start_line:end_line]
-            code = '\n'.join(code_lines)
+            last_line = target_func.end_line_number
+            truncated = max_lines is not None and last_line - target_func.line_number >= max_lines
+            if truncated:
+                last_line = target_func.line_number + max_lines - 1
             
-            caller_names = set()
-            for caller_key in node.callers:
-                if caller_key in graph.nodes:
-                    caller_names.add(graph.nodes[caller_key].function_name)
+            code = read_line_range(file_path, line_offsets, target_func.line_number, last_line)
             
-            callee_names = set()
-            for callee_key in node.callees:
-                if callee_key in graph.nodes:
-                    callee_names.add(graph.nodes[callee_key].function_name)
+            nodes = graph.nodes
+            caller_names = {nodes[key].function_name for key in node.callers if key in nodes}
+            callee_names = {nodes[key].function_name for key in node.callees if key in nodes}
             
-            return {
+            code_data = {
                 'code': code,
                 'language': language,
                 'start_line': target_func.line_number,
@@ -890,14 +1222,24 @@ def extract_function_code(node: CallGraphNode, graph: CallGraph) -> Dict[str, An
                 'function_name': node.function_name
             }
         else:
-            return {
-                'code': content,
+            truncated = max_lines is not None and count_file_lines(file_path, line_offsets) > max_lines
+            if truncated:
+                code = read_line_range(file_path, line_offsets, 1, max_lines)
+            else:
+                code = file_path.read_text(encoding='utf-8')
+            
+            code_data = {
+                'code': code,
                 'language': language,
                 'start_line': node.line_number,
                 'end_line': node.line_number + 10,
                 'callers': [],
                 'callees': []
             }
+        
+        if truncated:
+            code_data['truncated'] = True
+        return code_data
     except Exception as e:
         return {
             'code': f'Error reading file: {str(e)}',
@@ -909,6 +1251,107 @@ def extract_function_code(node: CallGraphNode, graph: CallGraph) -> Dict[str, An
         }
 
 
+def read_line_range(
+    file_path: Path,
+    line_offsets: array,
+    first_line: int,
+    last_line: int
+) -> str:
+    """
+    Read a 1-based inclusive line range by seeking to its byte offsets.
+    
+    Preconditions: line_offsets from compute_line_offsets for the file's current content,
+                   file is UTF-8, first_line positive
+    Postconditions: returns lines joined by newlines without trailing newline,
+                    line endings translated as read_text does
+    """
+    assert first_line > 0, "Line numbers start at 1"
+    
+    if first_line > len(line_offsets) or last_line < first_line:
+        return ''
+    
+    start = line_offsets[first_line - 1]
+    ends_before_last_line = last_line < len(line_offsets)
+    with open(file_path, 'rb') as stream:
+        stream.seek(start)
+        if ends_before_last_line:
+            data = stream.read(line_offsets[last_line] - start)
+        else:
+            data = stream.read()
+    
+    text = normalize_newlines(data).decode('utf-8')
+    return text[:-1] if ends_before_last_line and text else text
+
+
+def count_file_lines(file_path: Path, line_offsets: array) -> int:
+    """
+    Count lines as read_text().splitlines() would.
+    
+    Preconditions: line_offsets from compute_line_offsets for the file's current content
+    Postconditions: returns line count, not counting the empty remainder after a final line break
+    """
+    count = len(line_offsets)
+    if count > 1 and line_offsets[-1] == file_path.stat().st_size:
+        count -= 1
+    
+    assert count >= 1, "Line offsets always hold the first line"
+    return count
+
+
+def compute_line_offsets(content: bytes) -> array:
+    """
+    Find the byte offset where each line starts.
+    
+    Preconditions: content is raw file bytes
+    Postconditions: returns offsets with 0 first, one more after each CRLF, CR or LF
+    """
+    offsets = array('Q', [0])
+    offsets.extend(match.end() for match in LINE_BREAK_PATTERN.finditer(content))
+    
+    assert offsets[0] == 0, "First line starts at offset 0"
+    return offsets
+
+
+def get_parsed_source(file_path: str) -> Tuple[Dict[Tuple[str, int], FunctionInfo], array]:
+    """
+    Parse source file into a (name, line_number) index and line offset table,
+    reused while mtime and size are unchanged.
+    
+    Preconditions: file_path points to existing file
+    Postconditions: returns index and offsets shared with the cache, not to be mutated;
+                    first function wins on duplicate keys; at most PARSED_FILE_CACHE_SIZE
+                    files kept, least recently used evicted; safe across request threads
+    """
+    assert file_path, "File path required"
+    
+    stat_result = os.stat(file_path)
+    with PARSED_FILE_CACHE_LOCK:
+        cached = PARSED_FILE_CACHE.get(file_path)
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            PARSED_FILE_CACHE.move_to_end(file_path)
+            return cached[2], cached[3]
+    
+    with open(file_path, 'rb') as handle:
+        stat_result = os.fstat(handle.fileno())
+        content = handle.read()
+    
+    index: Dict[Tuple[str, int], FunctionInfo] = {}
+    language = get_language_for_file(file_path)
+    if language:
+        for func in extract_functions_by_content(normalize_newlines(content), file_path, language):
+            index.setdefault((func.name, func.line_number), func)
+    line_offsets = compute_line_offsets(content)
+    
+    with PARSED_FILE_CACHE_LOCK:
+        PARSED_FILE_CACHE[file_path] = (stat_result.st_mtime_ns, stat_result.st_size, index, line_offsets)
+        PARSED_FILE_CACHE.move_to_end(file_path)
+        if len(PARSED_FILE_CACHE) > PARSED_FILE_CACHE_SIZE:
+            PARSED_FILE_CACHE.popitem(last=False)
+    
+    assert line_offsets[0] == 0, "Offsets must start at first line"
+    return index, line_offsets
+
+
 def update_contract_from_data(contract: FunctionContract, data: Dict[str, Any]) -> None:
     """
     Update contract fields from request data.
@@ -929,21 +1372,37 @@ def update_contract_from_data(contract: FunctionContract, data: Dict[str, Any])
         contract.output_prediction = str(data['output_prediction'])
     
     if 'abstraction_level' in data:
-        try:
-            contract.abstraction_level = AbstractionLevel(data['abstraction_level'])
-        except ValueError:
-            pass
+        level_value = data['abstraction_level']
+        level = LEVEL_BY_VALUE.get(level_value) if isinstance(level_value, str) else None
+        if level is not None:
+            contract.abstraction_level = level
     
     if 'preconditions' in data:
-        preconditions = data['preconditions']
-        if isinstance(preconditions, list):
-            contract.preconditions = [str(p) for p in preconditions]
+        preconditions = coerce_string_list(data['preconditions'])
+        if preconditions is not None:
+            contract.preconditions = preconditions
     
     if 'postconditions' in data:
-        postconditions = data['postconditions']
-        if isinstance(postconditions, list):
-            contract.postconditions = [str(p) for p in postconditions]
+        postconditions = coerce_string_list(data['postconditions'])
+        if postconditions is not None:
+            contract.postconditions = postconditions
     
     if 'metadata' in data:
         if isinstance(data['metadata'], dict):
             contract.metadata.update(data['metadata'])
+
+
+def coerce_string_list(value: Any) -> Optional[List[str]]:
+    """
+    Coerce list from request data to list of strings.
+    
+    Preconditions: value decoded from request JSON
+    Postconditions: returns new list of str(item), or None if value is not a list
+    """
+    if not isinstance(value, list):
+        return None
+    
+    result = [str(item) for item in value]
+    
+    assert len(result) == len(value), "One string per item"
+    return result